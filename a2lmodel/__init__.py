@@ -14,7 +14,9 @@ from .a2l_model import (
     Group,
     Function,
     DaqEvent,
-    MemorySegment
+    MemorySegment,
+    MeasurementTable,
+    CharacteristicTable
 )
 
 __all__ = [
@@ -29,5 +31,7 @@ __all__ = [
     "Group",
     "Function",
     "DaqEvent",
-    "MemorySegment"
+    "MemorySegment",
+    "MeasurementTable",
+    "CharacteristicTable"
 ]
\ No newline at end of file
@@ -0,0 +1,16 @@
+# Declarations for the optional Cython build (see setup.py). Cython reads this
+# file next to a2l_model.py when compiling it; the pure Python module ignores it.
+cimport cython
+
+
+# BlockBuilder.feed_line runs once per input line: as an extension type its
+# attributes become C struct slots and the per-line locals C-typed references.
+cdef class BlockBuilder:
+    cdef public object root
+    cdef public list stack
+    cdef public dict record_handlers
+    cdef object _record_parent
+    cdef object _record
+
+    @cython.locals(s=str, name=str, args_str=str, args=list, parent=object, blk=object)
+    cpdef feed_line(self, str line)
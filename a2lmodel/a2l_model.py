@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+# cython: language_level=3
 """
 A minimal A2L parser tailored for the provided file.
 Parses and holds:
@@ -30,10 +31,23 @@ Usage:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Optional, Dict, Any, Tuple, Callable, Container, Deque, Iterable, Iterator, IO, Sequence, cast
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from itertools import islice, repeat
+import codecs
+import copy
+import mmap
+import json
+import os
 import re
 import shlex
+import stat
 import sys
 from pathlib import Path
 
@@ -42,6 +56,40 @@ from pathlib import Path
 # Utilities
 # --------------------------
 
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+# A non-empty line of text (blank lines are dropped by BlockBuilder anyway)
+_LINE_RE = re.compile(r"[^\r\n]+")
+# Keys only match upper-case keywords, so no case normalization is needed after a match
+_KV_RE = re.compile(r"^([A-Z0-9_]+)\s+(\S+)$")
+# A token standing alone between shlex whitespace: a double-quoted string without
+# backslashes (group 1, quotes stripped) or a bare word without quotes or
+# backslashes (group 2). Anything else (escapes, single quotes, quoted parts
+# touching other text, unbalanced quotes) matches the last alternative, which
+# has no group, and the line is then split by shlex instead.
+_TOKEN_RE = re.compile(r'"([^"\\]*)"(?![^ \t\r\n])|([^ \t\r\n"\'\\]+)(?![^ \t\r\n])|[^ \t\r\n]+')
+# A line holding exactly one such quoted string (group 1, quotes stripped)
+_QUOTED_LINE_MATCH = re.compile(r'[ \t\r\n]*"([^"\\]*)"[ \t\r\n]*').fullmatch
+
+# Enumeration keywords repeated across thousands of records; parsed values are
+# mapped through this table so every record shares one interned str object.
+_INTERN: Dict[str, str] = {s: sys.intern(s) for s in (
+    # datatypes
+    "UBYTE", "SBYTE", "UWORD", "SWORD", "ULONG", "SLONG", "A_UINT64", "A_INT64",
+    "FLOAT16_IEEE", "FLOAT32_IEEE", "FLOAT64_IEEE",
+    # byte orders
+    "MSB_LAST", "MSB_FIRST", "LITTLE_ENDIAN", "BIG_ENDIAN", "MSB_FIRST_MSW_LAST", "MSB_LAST_MSW_FIRST",
+    "BYTE_ORDER_MSB_LAST", "BYTE_ORDER_MSB_FIRST",
+    # characteristic types
+    "ASCII", "CURVE", "MAP", "CUBOID", "CUBE_4", "CUBE_5", "VAL_BLK", "VALUE",
+    # conversion types
+    "IDENTICAL", "FORM", "LINEAR", "RAT_FUNC", "TAB_INTP", "TAB_NOINTP", "TAB_VERB",
+    # DAQ event types
+    "DAQ", "STIM", "DAQ_STIM",
+    # memory segment classes and memory types
+    "CALIBRATION_VARIABLES", "CODE", "DATA", "EXCLUDE_FROM_FLASH", "OFFLINE_DATA", "RESERVED", "SERAM", "VARIABLES",
+    "EEPROM", "EPROM", "FLASH", "RAM", "ROM", "REGISTER", "NOT_IN_ECU",
+)}
+
 def strip_block_comments(text: str) -> str:
     """
     Remove C-style block comments from A2L text.
@@ -56,7 +104,226 @@ def strip_block_comments(text: str) -> str:
         >>> strip_block_comments('text /* comment */ text')
         'text  text'
     """
-    return re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    return _BLOCK_COMMENT_RE.sub("", text)
+
+class _CommentStripper:
+    """
+    Block comment state carried from line to line, for lines that may hold "/*" or "*/".
+
+    Lines are stripped as read, but while a comment is open they are held back:
+    a "/*" that is never closed is not a comment (as for ``strip_block_comments``),
+    and ``finish`` then returns the held lines unstripped from that "/*" on.
+    Every line fed comes out exactly once, in order.
+    """
+    __slots__ = ("in_comment", "held", "raw")
+
+    def __init__(self) -> None:
+        self.in_comment = False
+        self.held: list[str] = []  # stripped lines since the open "/*"
+        self.raw: list[str] = []  # the same lines as read, from the "/*" on
+
+    def feed(self, line: str) -> list[str]:
+        """Strip one line; return the lines that can be passed on (none while a comment is open)."""
+        out: list[str] = []
+        parts: list[str] = []
+        in_comment = self.in_comment
+        opened = -1  # position of a "/*" in this line still open
+        pos = 0
+        while True:
+            if in_comment:
+                end = line.find("*/", pos)
+                if end < 0:
+                    break
+                pos = end + 2
+                in_comment = False
+                opened = -1
+                if self.held:
+                    out, self.held, self.raw = self.held, [], []
+            else:
+                start = line.find("/*", pos)
+                if start < 0:
+                    parts.append(line[pos:])
+                    break
+                parts.append(line[pos:start])
+                pos = start + 2
+                in_comment = True
+                opened = start
+        text = "".join(parts)
+        self.in_comment = in_comment
+        if not in_comment:
+            out.append(text)
+        elif opened >= 0:
+            self.held, self.raw = [text], [text + line[opened:]]
+        else:
+            self.held.append(text)
+            self.raw.append(line)
+        return out
+
+    def finish(self) -> list[str]:
+        """Return the held lines unstripped if the last "/*" was never closed."""
+        raw, self.held, self.raw = self.raw, [], []
+        return raw
+
+def _iter_uncommented(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield lines with C-style block comments removed.
+
+    Comment state is carried from line to line, so comments spanning several
+    lines are handled without joining the text; lines without "/*" (and not
+    inside a comment) are passed through untouched. A "/*" never closed is
+    left in place, with all lines after it.
+    """
+    stripper = _CommentStripper()
+    for line in lines:
+        if not stripper.in_comment and "/*" not in line:
+            yield line
+        else:
+            yield from stripper.feed(line)
+    yield from stripper.finish()
+
+def _iter_uncommented_blocks(blocks: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the non-empty lines of text blocks with C-style block comments removed.
+
+    Each block holds whole lines and is split at \\n, \\r\\n or \\r. A block
+    without "/*" that does not start inside a comment, as nearly all are, is
+    passed on after a single substring search; the others are handled line by
+    line as in ``_iter_uncommented``.
+    """
+    stripper = _CommentStripper()
+    for text in blocks:
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        lines = filter(None, text.split("\n"))
+        if not stripper.in_comment and "/*" not in text:
+            yield from lines
+            continue
+        for line in lines:
+            if not stripper.in_comment and "/*" not in line:
+                yield line
+            else:
+                yield from stripper.feed(line)
+    yield from stripper.finish()
+
+# Text decoded or sliced per step: blocks end at a line break, so that lines
+# are never split, and in files after a newline (or, in files without one,
+# such as to_file() writes, a carriage return), which is never part of a
+# multi-byte sequence, so each block decodes on its own
+_DECODE_BLOCK_SIZE = 1 << 16
+
+def _check_encoding(encoding: str) -> None:
+    """Reject encodings in which line breaks are not the single bytes ``b"\\n"`` and ``b"\\r"``."""
+    encoder = codecs.getincrementalencoder(encoding)()
+    # the first line break may come with a byte order mark (e.g. "utf-8-sig")
+    encoder.encode("\n")
+    if encoder.encode("\n\r") != b"\n\r":
+        raise ValueError(f"encoding {encoding!r} is not ASCII-compatible")
+
+def _iter_decoded_blocks(mm: mmap.mmap, encoding: str) -> Iterator[str]:
+    """Decode a mapped file in blocks of whole lines."""
+    size = len(mm)
+    pos = 0
+    while pos < size:
+        stop = pos + _DECODE_BLOCK_SIZE
+        end = mm.rfind(b"\n", pos, stop) + 1 or mm.rfind(b"\r", pos, stop) + 1
+        if not end:
+            # a single line longer than the block size
+            breaks = [i for i in (mm.find(b"\n", stop), mm.find(b"\r", stop)) if i >= 0]
+            end = min(breaks) + 1 if breaks else size
+        yield mm[pos:end].decode(encoding, "ignore")
+        pos = end
+
+def _iter_read_blocks(f: IO[bytes], encoding: str) -> Iterator[str]:
+    """Read and decode a file that cannot be mapped (e.g. a pipe) in blocks of whole lines."""
+    pending: list[bytes] = []  # read since the last line break
+    while True:
+        chunk = f.read(_DECODE_BLOCK_SIZE)
+        if not chunk:
+            break
+        cut = chunk.rfind(b"\n") + 1 or chunk.rfind(b"\r") + 1
+        if not cut:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:cut])
+        yield b"".join(pending).decode(encoding, "ignore")
+        pending = [chunk[cut:]]
+    rest = b"".join(pending)
+    if rest:
+        yield rest.decode(encoding, "ignore")
+
+def _iter_text_blocks(text: str) -> Iterator[str]:
+    """Slice text into blocks of whole lines."""
+    size = len(text)
+    pos = 0
+    while pos < size:
+        end = pos + _DECODE_BLOCK_SIZE
+        if end < size:
+            cut = max(text.rfind("\n", pos, end), text.rfind("\r", pos, end)) + 1
+            if cut > pos:
+                end = cut
+            else:
+                # a single line longer than the block size
+                breaks = [i for i in (text.find("\n", end), text.find("\r", end)) if i >= 0]
+                end = min(breaks) + 1 if breaks else size
+        yield text[pos:end]
+        pos = end
+
+def iter_lines_no_comments(path: str | Path, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Stream the lines of an A2L file with C-style block comments removed.
+
+    The file is memory-mapped and decoded in blocks of whole lines (about
+    64 KiB each), so neither the whole file contents nor a comment-free copy
+    of it is ever materialized. Files that cannot be mapped, such as pipes,
+    are read in blocks instead.
+    
+    Args:
+        path: Path to the A2L file
+        encoding: ASCII-compatible text encoding of the file; undecodable
+            bytes are dropped
+        
+    Yields:
+        Decoded non-empty lines without line endings (a line holding only a
+        comment is yielded as "")
+
+    Raises:
+        ValueError: If the encoding is not ASCII-compatible (e.g. UTF-16)
+    """
+    _check_encoding(encoding)
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if stat.S_ISREG(st.st_mode) and st.st_size == 0:
+            # empty files cannot be mapped
+            return
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield from _iter_uncommented_blocks(_iter_read_blocks(f, encoding))
+            return
+        with mm:
+            yield from _iter_uncommented_blocks(_iter_decoded_blocks(mm, encoding))
+
+def iter_text_lines_no_comments(text: str) -> Iterator[str]:
+    """
+    Stream the non-empty lines of A2L text with C-style block comments removed.
+
+    The text counterpart of ``iter_lines_no_comments``: lines are split out of
+    ``text`` in blocks of whole lines (at \\n, \\r\\n or \\r, like the file
+    reader), so neither a comment-free copy of the text nor a list of all its
+    lines is built. ``//`` line comments are left in place, as by the file reader.
+
+    Example:
+        >>> list(iter_text_lines_no_comments('A /* x\\n y */ B\\r\\nC'))
+        ['A ', ' B', 'C']
+    """
+    return _iter_uncommented_blocks(_iter_text_blocks(text))
+
+# Conversion fast paths: int()/float() can never succeed on a token starting with
+# one of these characters (only "inf"/"nan" words for float), so the exception
+# they would raise for keywords and names is skipped
+_HEX_PREFIXES = ("0x", "0X")
+_NON_NUMERIC_START = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_"/%')
+_FLOAT_WORDS = frozenset(("inf", "infinity", "nan"))
 
 def to_int(token: str) -> int | None:
     """
@@ -77,8 +344,12 @@ def to_int(token: str) -> int | None:
         None
     """
     try:
-        if token.lower().startswith("0x"):
+        if token.isascii() and token.isdigit():
+            return int(token)
+        if token[:2] in _HEX_PREFIXES:
             return int(token, 16)
+        if token[:1] in _NON_NUMERIC_START:
+            return None
         return int(token)
     except Exception:
         return None
@@ -100,13 +371,41 @@ def to_float(token: str) -> float | None:
         None
     """
     try:
+        c = token[:1]
+        if c in _NON_NUMERIC_START and not (c in "iInN" and token.lower() in _FLOAT_WORDS):
+            return None
         return float(token)
     except Exception:
         return None
 
-def tokenize_line(line: str) -> list[str]:
+def _parse_num(token: str) -> float | int | None:
+    """
+    Convert a numeric token in a single attempt: hexadecimal to int, anything else to float.
+
+    Equivalent to ``to_float(token) if to_float(token) is not None else to_int(token)``
+    but converts each token only once.
+
+    Example:
+        >>> _parse_num("0x10")
+        16
+        >>> _parse_num("3.4e+38")
+        3.4e+38
+        >>> _parse_num("UWORD")
+        None
+    """
+    if token[:2] in _HEX_PREFIXES:
+        return to_int(token)
+    return to_float(token)
+
+def tokenize_line(line: str, _finditer: Callable[[str], Iterator[re.Match[str]]] = _TOKEN_RE.finditer) -> list[str]:
     """
     Tokenize a line of A2L text, handling quoted strings properly.
+
+    Tokens are split as by ``shlex.split(line, posix=True)``. A precompiled
+    regex handles the plain bare words and double-quoted strings of nearly
+    all lines; only lines with escapes, single quotes or quoted parts touching
+    other text go through shlex. Lines with unbalanced quotes, which shlex
+    rejects, are split at whitespace.
     
     Args:
         line: A single line of A2L text
@@ -118,7 +417,32 @@ def tokenize_line(line: str) -> list[str]:
         >>> tokenize_line('NAME "Long Description" VALUE')
         ['NAME', 'Long Description', 'VALUE']
     """
-    return shlex.split(line, posix=True)
+    tokens = [m.group(1) if m.group(1) is not None else m.group(2) for m in _finditer(line)]
+    return _shlex_tokens(line) if None in tokens else tokens
+
+def _shlex_tokens(line: str) -> list[str]:
+    """Split a line that the token regex cannot, like ``_split_args`` does."""
+    try:
+        return shlex.split(line, posix=True)
+    except ValueError:
+        return line.split()
+
+def flat_tokens(lines: Iterable[str], _finditer: Callable[[str], Iterator[re.Match[str]]] = _TOKEN_RE.finditer) -> list[str]:
+    """
+    Tokenize several lines into a single flat token list.
+
+    Same tokens as flattening ``tokenize_line`` over each line, but built in
+    one pass without the intermediate per-line lists (unless a line needs
+    shlex).
+    
+    Example:
+        >>> flat_tokens(['DAQ 1', '"name" 2'])
+        ['DAQ', '1', 'name', '2']
+    """
+    if not isinstance(lines, list):
+        lines = list(lines)
+    flat = [m.group(1) if m.group(1) is not None else m.group(2) for ln in lines for m in _finditer(ln)]
+    return [tok for ln in lines for tok in tokenize_line(ln)] if None in flat else flat
 
 def unquote(s: str) -> str:
     """
@@ -142,12 +466,64 @@ def unquote(s: str) -> str:
         return s[1:-1]
     return s
 
+# Strings seen in the current parse, so that repeats share one object: A2LParser
+# sets a fresh dict per parse and drops it afterwards (None outside a parse).
+# Unlike sys.intern, whose strings are immortal on CPython 3.12, nothing here
+# outlives the models using it.
+_PARSE_STRINGS: ContextVar[Dict[str, str] | None] = ContextVar("_PARSE_STRINGS", default=None)
+
+@contextmanager
+def _sharing_strings() -> Iterator[None]:
+    """Share equal strings within the parse run in this context (also usable as a decorator)."""
+    token = _PARSE_STRINGS.set({})
+    try:
+        yield
+    finally:
+        _PARSE_STRINGS.reset(token)
+
+def _shared(s: str) -> str:
+    """``s``, or the equal string already seen in the current parse."""
+    strings = _PARSE_STRINGS.get()
+    return s if strings is None else strings.setdefault(s, s)
+
+def _line_text(tokens: list[str]) -> str:
+    """
+    Text of a description-style line, i.e. ``unquote(" ".join(tokens))``.
+
+    A quoted string is almost always the only token on such a line, so the
+    join is skipped for that case. Generated A2Ls repeat the same
+    descriptions, formats and units thousands of times, so within a parse the
+    result is shared through ``_shared``.
+
+    Example:
+        >>> _line_text(["Engine speed"]), _line_text(["a", "b"]), _line_text([])
+        ('Engine speed', 'a b', '')
+    """
+    return _shared(unquote(tokens[0] if len(tokens) == 1 else " ".join(tokens)))
+
+def _line_description(line: str) -> str:
+    """
+    ``_line_text(tokenize_line(line))``, without tokenizing the usual case of a
+    line holding a single quoted string.
+
+    Example:
+        >>> _line_description('  "Engine speed"'), _line_description('"a" b')
+        ('Engine speed', 'a b')
+    """
+    m = _QUOTED_LINE_MATCH(line)
+    if m is not None:
+        return _shared(unquote(m.group(1)))
+    return _line_text(tokenize_line(line))
+
 
 # --------------------------
 # Block tree representation
 # --------------------------
 
-@dataclass
+# Blocks and high-count records drop their per-instance __dict__ where supported (Python 3.10+)
+_DC_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DC_SLOTS)
 class A2LBlock:
     """
     Represents a single A2L block with hierarchical structure.
@@ -157,11 +533,51 @@ class A2LBlock:
         args: List of arguments passed to the block in the /begin statement
         lines: Raw text lines contained within this block
         children: Child blocks nested within this block
+        tokens: Tokens of each non-empty line, computed once on first access
+        flat: All tokens of the block in a single list, computed once on first access
     """
     name: str
     args: list[str] = field(default_factory=list)
     lines: list[str] = field(default_factory=list)  # raw lines inside this block (including children)
     children: list["A2LBlock"] = field(default_factory=list)
+    _tokens: list[list[str]] | None = field(default=None, init=False, repr=False, compare=False)
+    _flat: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _by_name: Dict[str, list[A2LBlock]] | None = field(default=None, init=False, repr=False, compare=False)
+    _by_name_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def tokens(self) -> list[list[str]]:
+        """Tokenized non-empty lines of this block (cached)."""
+        if self._tokens is None:
+            self._tokens = [t for t in map(tokenize_line, self.lines) if t]
+        return self._tokens
+
+    @property
+    def flat(self) -> list[str]:
+        """All tokens of this block flattened across lines (cached)."""
+        if self._flat is None:
+            if self._tokens is not None:
+                self._flat = [tok for line in self._tokens for tok in line]
+            else:
+                self._flat = flat_tokens(self.lines)
+        return self._flat
+
+    @property
+    def children_by_name(self) -> Dict[str, list[A2LBlock]]:
+        """
+        Children grouped by upper-cased name, in order.
+
+        Built on first use and rebuilt if children were appended since; treat
+        the returned dict and lists as read-only.
+        """
+        by_name = self._by_name
+        if by_name is None or self._by_name_count != len(self.children):
+            by_name = {}
+            for c in self.children:
+                by_name.setdefault(sys.intern(c.name.upper()), []).append(c)
+            self._by_name = by_name
+            self._by_name_count = len(self.children)
+        return by_name
 
     def get_children(self, name: str) -> list[A2LBlock]:
         """
@@ -173,7 +589,7 @@ class A2LBlock:
         Returns:
             List of matching child blocks
         """
-        return [c for c in self.children if c.name.upper() == name.upper()]
+        return list(self.children_by_name.get(name.upper(), ()))
 
     def get_first_child(self, name: str) -> A2LBlock | None:
         """
@@ -185,7 +601,7 @@ class A2LBlock:
         Returns:
             First matching child block, or None if not found
         """
-        kids = self.get_children(name)
+        kids = self.children_by_name.get(name.upper())
         return kids[0] if kids else None
 
 
@@ -193,6 +609,72 @@ class A2LBlock:
 # Dataclasses for structured model
 # --------------------------
 
+# Fields left out of to_dict() output for models parsed without keep_raw
+_RAW_FIELDS = frozenset(("raw", "raw_blocks"))
+
+# Field annotations whose values are emitted by to_dict() as they are
+_LEAF_TYPES = frozenset(("str", "str | None", "int", "int | None", "float | None", "bool"))
+
+_TO_DICT: Dict[type, Callable[[Any, bool], dict[str, Any]]] = {}
+
+def _compile_to_dict(cls: type) -> Callable[[Any, bool], dict[str, Any]]:
+    """
+    Generate a ``to_dict`` converter for dataclass ``cls`` that builds a literal dict.
+
+    Scalar fields are copied directly, ``list[str]`` fields with ``list()``,
+    and anything else goes through ``_as_dict``. Underscore-prefixed (cache)
+    fields are skipped, and ``raw``/``raw_blocks`` fields are emitted only
+    when the converter's ``raw`` argument is true, whatever they hold.
+    """
+    fname = f"_{cls.__name__}_to_dict"
+    body = [f"def {fname}(obj, raw):", "    d = {"]
+    tail = []  # assignments after the dict literal, keeping the field order
+    for f in fields(cls):
+        if f.name.startswith("_"):
+            continue
+        if f.type in _LEAF_TYPES:
+            expr = f"obj.{f.name}"
+        elif f.type == "list[str]":
+            expr = f"list(obj.{f.name})"
+        else:
+            expr = f"_as_dict(obj.{f.name}, raw)"
+        if f.name in _RAW_FIELDS:
+            tail += ["    if raw:", f"        d[{f.name!r}] = {expr}"]
+        elif tail:
+            tail.append(f"    d[{f.name!r}] = {expr}")
+        else:
+            body.append(f"        {f.name!r}: {expr},")
+    body.append("    }")
+    body += tail
+    body.append("    return d")
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(body), f"<a2l to_dict {cls.__name__}>", "exec"), globals(), namespace)
+    return cast("Callable[[Any, bool], dict[str, Any]]", namespace[fname])
+
+def _as_dict(obj: Any, raw: bool) -> Any:
+    """
+    Convert a dataclass instance (recursively) into plain dicts, lists and tuples.
+    ``array.array`` fields become lists; ``raw``/``raw_blocks`` fields are
+    included only if ``raw`` is true.
+
+    Unlike ``dataclasses.asdict`` this neither deep-copies leaf values nor
+    reflects on the fields at every call: each class gets a generated
+    converter (see ``_compile_to_dict``) on first use.
+    """
+    cls = type(obj)
+    conv = _TO_DICT.get(cls)
+    if conv is None:
+        if cls is list:
+            return [_as_dict(x, raw) for x in obj]
+        if cls is tuple:
+            return tuple(_as_dict(x, raw) for x in obj)
+        if cls is array:
+            return obj.tolist()
+        if not is_dataclass(cls):
+            return obj
+        conv = _TO_DICT[cls] = _compile_to_dict(cls)
+    return conv(obj, raw)
+
 @dataclass
 class ProtocolLayer:
     """
@@ -200,7 +682,7 @@ class ProtocolLayer:
     
     Attributes:
         version: Protocol version number
-        timing_values: List of timing parameters (T1-T7)
+        timing_values: Timing parameters (T1-T7) as an ``array('q')``
         max_cto: Maximum Command Transfer Object size
         max_dto: Maximum Data Transfer Object size
         byte_order: Byte order (e.g., "MSB_LAST", "MSB_FIRST")
@@ -212,7 +694,7 @@ class ProtocolLayer:
         raw: Raw A2L text lines for this block
     """
     version: int | None = None
-    timing_values: list[int] = field(default_factory=list)  # T1..T7 etc
+    timing_values: array = field(default_factory=lambda: array("q"))  # T1..T7 etc
     max_cto: int | None = None
     max_dto: int | None = None
     byte_order: str | None = None
@@ -223,7 +705,7 @@ class ProtocolLayer:
     master_min_st: int | None = None
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class DaqEvent:
     """
     Represents a DAQ event configuration.
@@ -349,7 +831,7 @@ class XcpOnCanConfig:
     can_fd: XcpOnCanFdConfig | None = None
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class PageInfo:
     """
     Memory page information for segmented memory.
@@ -365,7 +847,7 @@ class PageInfo:
     xcp_read_access: str | None
     xcp_write_access: str | None
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class SegmentInfo:
     """
     Memory segment information including pages and protection parameters.
@@ -389,7 +871,7 @@ class SegmentInfo:
     pages: list[PageInfo] = field(default_factory=list)
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class MemorySegment:
     """
     Represents a memory segment with address, size, and protection attributes.
@@ -415,7 +897,7 @@ class MemorySegment:
     segment_info: SegmentInfo | None = None
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class AxisPts:
     """
     Represents axis points data structure for calibration curves.
@@ -451,7 +933,7 @@ class AxisPts:
     symbol_link: tuple[str | None, int | None] | None = None
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Measurement:
     """
     Represents a measurement (MEASUREMENT) element in the A2L file.
@@ -482,7 +964,7 @@ class Measurement:
     raw: list[str] = field(default_factory=list)
 
 # NEW: Characteristic dataclass
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Characteristic:
     name: str
     description: str
@@ -496,17 +978,17 @@ class Characteristic:
     symbol_link: tuple[str | None, int | None] | None = None
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class CompuMethod:
     name: str
     description: str
     method_type: str  # e.g., RAT_FUNC
     format_str: str | None
     unit: str | None
-    coeffs: list[float] = field(default_factory=list)
+    coeffs: array = field(default_factory=lambda: array("d"))
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class CompuVTab:
     name: str
     description: str
@@ -514,26 +996,190 @@ class CompuVTab:
     entries: list[tuple[int, str]] = field(default_factory=list)
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class RecordLayout:
     name: str
     entries: list[str] = field(default_factory=list)
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Group:
     name: str
     description: str
     ref_measurements: list[str] = field(default_factory=list)
     raw: list[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(**_DC_SLOTS)
 class Function:
     name: str
     description: str
     loc_measurements: list[str] = field(default_factory=list)
     raw: list[str] = field(default_factory=list)
 
+# --------------------------
+# Column-oriented (struct-of-arrays) tables
+# --------------------------
+
+class RecordView:
+    """
+    One row of a RecordTable; fields are read from the table's columns on attribute access.
+    """
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: RecordTable, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # unset slots (e.g. while copying or unpickling) must not reach self._table
+            raise AttributeError(name)
+        return self._table.value(name, self._row)
+
+    def __repr__(self) -> str:
+        return f"{type(self._table).__name__}[{self._row}]({self._table.value('name', self._row)!r})"
+
+
+class RecordTable:
+    """
+    Struct-of-arrays copy of a list of parsed records.
+
+    Integer fields are stored in ``array('Q')`` columns (a column holding a
+    negative value falls back to a plain list) and float fields in ``array('d')``
+    columns, both with a presence mask for None; enumeration fields as ``array('H')``
+    codes into a per-table codebook, and all other fields in plain lists.
+    Scans over one field (filter by datatype, sort by address, bulk export)
+    then walk a dense column instead of one object per record.
+
+    Subclasses declare which record fields go into which kind of column.
+    """
+    int_fields: Tuple[str, ...] = ()
+    float_fields: Tuple[str, ...] = ()
+    enum_fields: Tuple[str, ...] = ()
+    object_fields: Tuple[str, ...] = ("name",)
+
+    def __init__(self, records: Iterable[Any] = ()) -> None:
+        self._columns: Dict[str, Any] = {}
+        self._kinds: Dict[str, str] = {}
+        self._codebooks: Dict[str, list[Any]] = {}
+        self._codes: Dict[str, Dict[Any, int]] = {}
+        self._present: Dict[str, bytearray] = {}
+        for name in self.int_fields:
+            self._columns[name] = array("Q")
+            self._kinds[name] = "int"
+            self._present[name] = bytearray()
+        for name in self.float_fields:
+            self._columns[name] = array("d")
+            self._kinds[name] = "float"
+            self._present[name] = bytearray()
+        for name in self.enum_fields:
+            self._columns[name] = array("H")
+            self._kinds[name] = "enum"
+            self._codebooks[name] = []
+            self._codes[name] = {}
+        for name in self.object_fields:
+            self._columns[name] = []
+            self._kinds[name] = "object"
+        for record in records:
+            self.append(record)
+
+    def append(self, record: Any) -> None:
+        """Append one record (any object with the table's fields as attributes)."""
+        columns = self._columns
+        for name in self.int_fields:
+            v = getattr(record, name)
+            self._present[name].append(v is not None)
+            try:
+                columns[name].append(0 if v is None else v)
+            except OverflowError:
+                columns[name] = list(columns[name])
+                columns[name].append(v)
+        for name in self.float_fields:
+            v = getattr(record, name)
+            self._present[name].append(v is not None)
+            columns[name].append(float("nan") if v is None else v)
+        for name in self.enum_fields:
+            columns[name].append(self._code(name, getattr(record, name)))
+        for name in self.object_fields:
+            columns[name].append(getattr(record, name))
+
+    def _code(self, name: str, value: Any) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._codebooks[name])
+            self._codebooks[name].append(value)
+        return code
+
+    def column(self, name: str) -> Any:
+        """Return the raw column of a field (array or list; enum fields return their codes, int and float fields hold 0 and NaN for None)."""
+        return self._columns[name]
+
+    def codebook(self, name: str) -> list[Any]:
+        """Return the distinct values of an enumeration field, indexed by code."""
+        return self._codebooks[name]
+
+    def value(self, name: str, row: int) -> Any:
+        """Return the field value of a row, with missing values restored to None."""
+        kind = self._kinds.get(name)
+        if kind is None:
+            raise AttributeError(name)
+        v = self._columns[name][row]
+        if kind == "int" or kind == "float":
+            return v if self._present[name][row] else None
+        if kind == "enum":
+            return self._codebooks[name][v]
+        return v
+
+    def rows_where(self, name: str, value: Any) -> list[int]:
+        """Return the row indices whose field equals value."""
+        column = self._columns[name]
+        kind = self._kinds.get(name)
+        if kind == "int" or kind == "float":
+            present = self._present[name]
+            if value is None:
+                return [i for i, p in enumerate(present) if not p]
+            if value != value:
+                # NaN never equals itself
+                return [i for i, v in enumerate(column) if v != v and present[i]]
+            return [i for i, v in enumerate(column) if v == value and present[i]]
+        if kind == "enum":
+            value = self._codes[name].get(value)
+            if value is None:
+                return []
+        return [i for i, v in enumerate(column) if v == value]
+
+    def __len__(self) -> int:
+        return len(self._columns["name"])
+
+    def __getitem__(self, row: int) -> RecordView:
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return RecordView(self, row)
+
+    def __iter__(self) -> Iterator[RecordView]:
+        for row in range(len(self)):
+            yield RecordView(self, row)
+
+
+class MeasurementTable(RecordTable):
+    """Columnar copy of MEASUREMENT records, see A2LModel.measurement_table()."""
+    int_fields = ("ecu_address", "address")
+    float_fields = ("lower_limit", "upper_limit")
+    enum_fields = ("datatype",)
+    object_fields = ("name", "description", "compu_method")
+
+
+class CharacteristicTable(RecordTable):
+    """Columnar copy of CHARACTERISTIC records, see A2LModel.characteristic_table()."""
+    int_fields = ("address",)
+    float_fields = ("max_diff", "lower_limit", "upper_limit")
+    enum_fields = ("char_type",)
+    object_fields = ("name", "description", "record_layout", "compu_method")
+
+
 @dataclass
 class A2LModel:
     """
@@ -563,19 +1209,43 @@ class A2LModel:
 
     raw_blocks: list[A2LBlock] = field(default_factory=list)
 
+    # Kept by A2LParser(incremental=True): the parsed text and the (start, end, tag,
+    # record) span of each MODULE record in it, for parse_text(..., prior=model)
+    _source: str | None = field(default=None, init=False, repr=False, compare=False)
+    _spans: list[Tuple[int, int, str, Any]] = field(default_factory=list, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict[str, Any]:
-        def conv(obj: Any) -> Any:
-            if hasattr(obj, "__dict__"):
-                return asdict(obj)
-            if isinstance(obj, list):
-                return [conv(x) for x in obj]
-            return obj
-        result = conv(self)
-        # Ensure we return a dict, not a list or other type
-        if isinstance(result, dict):
-            return result
-        # If the result is not a dict (e.g., from incorrect structure), return empty dict
-        return {}
+        """
+        Convert the model into a JSON-like dictionary.
+
+        The ``raw`` fields of all records and ``raw_blocks`` are included
+        exactly when the model holds a block tree, i.e. was parsed with
+        ``keep_raw``, even for records whose ``raw`` list is empty.
+        """
+        return cast("dict[str, Any]", _as_dict(self, bool(self.raw_blocks)))
+
+    def write_json(self, fp: IO[str], **kwargs: Any) -> None:
+        """
+        Write ``to_dict()`` as JSON to a text file object.
+
+        The output is encoded incrementally and written chunk by chunk, so the
+        complete JSON string is never held in memory.
+
+        Args:
+            fp: Writable text file object
+            **kwargs: Passed on to ``json.JSONEncoder`` (e.g. ``indent=2``)
+        """
+        write = fp.write
+        for chunk in json.JSONEncoder(**kwargs).iterencode(self.to_dict()):
+            write(chunk)
+
+    def measurement_table(self) -> MeasurementTable:
+        """Build a column-oriented copy of the measurements for bulk scans."""
+        return MeasurementTable(self.measurements)
+
+    def characteristic_table(self) -> CharacteristicTable:
+        """Build a column-oriented copy of the characteristics for bulk scans."""
+        return CharacteristicTable(self.characteristics)
 
     def to_a2l(self, indent: str = "\t") -> str:
         """Export the model to A2L file format.
@@ -814,7 +1484,82 @@ class A2LModel:
 # Parsing helpers for known blocks
 # --------------------------
 
-def parse_protocol_layer(block: A2LBlock) -> ProtocolLayer:
+def _raw(block: A2LBlock, keep_raw: bool) -> list[str]:
+    """
+    Source lines for a record's ``raw`` field, or an empty list when not kept.
+
+    The block's own line list is shared rather than copied: BlockBuilder
+    never appends to a block after its /end, and a block's lines do not
+    include those of its children, so nothing is duplicated.
+    """
+    return block.lines if keep_raw else []
+
+def _pl_optional_cmd(pl: ProtocolLayer, flat: list[str], i: int) -> None:
+    if i + 1 < len(flat):
+        pl.optional_cmds.append(flat[i + 1])
+
+def _pl_communication_mode(pl: ProtocolLayer, flat: list[str], i: int) -> None:
+    if i + 1 < len(flat):
+        pl.communication_mode = flat[i + 1]
+
+def _pl_master(pl: ProtocolLayer, flat: list[str], i: int) -> None:
+    if i + 2 < len(flat):
+        pl.master_max_bs = to_int(flat[i + 1])
+        pl.master_min_st = to_int(flat[i + 2])
+
+# Exact-token keyword handlers; enum tokens are matched by prefix only on a dict miss
+_PL_HANDLERS: Dict[str, Callable[[ProtocolLayer, list[str], int], None]] = {
+    "OPTIONAL_CMD": _pl_optional_cmd,
+    "COMMUNICATION_MODE_SUPPORTED": _pl_communication_mode,
+    "MASTER": _pl_master,
+}
+_PL_PREFIXES = ("BYTE_ORDER", "ADDRESS_GRANULARITY")
+
+def _daq_overload_indication(dq: DaqConfig, flat: list[str], i: int) -> None:
+    dq.overload_indication = "EVENT"
+
+def _daq_bit_stim_supported(dq: DaqConfig, flat: list[str], i: int) -> None:
+    dq.bit_stim_supported = True
+
+_DAQ_EVENT_TYPES = frozenset(("DAQ", "STIM", "DAQ_STIM"))
+
+_DAQ_HANDLERS: Dict[str, Callable[[DaqConfig, list[str], int], None]] = {
+    "OVERLOAD_INDICATION_EVENT": _daq_overload_indication,
+    "BIT_STIM_SUPPORTED": _daq_bit_stim_supported,
+}
+
+def _flag(value: str) -> bool:
+    return True
+
+# KEY -> (attribute, converter) for the "KEY value" lines of XCP_ON_CAN and CAN_FD
+_XCP_KEY_DISPATCH: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "CAN_ID_BROADCAST": ("can_id_broadcast", to_int),
+    "CAN_ID_MASTER": ("can_id_master", to_int),
+    "CAN_ID_SLAVE": ("can_id_slave", to_int),
+    "CAN_ID_GET_DAQ_CLOCK_MULTICAST": ("can_id_get_daq_clock_multicast", to_int),
+    "BAUDRATE": ("baudrate", to_int),
+    "SAMPLE_POINT": ("sample_point", to_int),
+    "SAMPLE_RATE": ("sample_rate", str),
+    "BTL_CYCLES": ("btl_cycles", to_int),
+    "SJW": ("sjw", to_int),
+    "SYNC_EDGE": ("sync_edge", str),
+    "MAX_DLC_REQUIRED": ("max_dlc_required", _flag),
+    "MAX_BUS_LOAD": ("max_bus_load", to_int),
+}
+
+_CAN_FD_KEY_DISPATCH: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "MAX_DLC": ("max_dlc", to_int),
+    "CAN_FD_DATA_TRANSFER_BAUDRATE": ("data_transfer_baudrate", to_int),
+    "SAMPLE_POINT": ("sample_point", to_int),
+    "BTL_CYCLES": ("btl_cycles", to_int),
+    "SJW": ("sjw", to_int),
+    "SYNC_EDGE": ("sync_edge", str),
+    "MAX_DLC_REQUIRED": ("max_dlc_required", _flag),
+    "SECONDARY_SAMPLE_POINT": ("secondary_sample_point", to_int),
+    "TRANSCEIVER_DELAY_COMPENSATION": ("tdc", str),
+}
+
+def parse_protocol_layer(block: A2LBlock, keep_raw: bool = True) -> ProtocolLayer:
     """
     Parse PROTOCOL_LAYER block from A2L file.
     
@@ -827,15 +1572,8 @@ def parse_protocol_layer(block: A2LBlock) -> ProtocolLayer:
     Example:
         >>> protocol_layer = parse_protocol_layer(protocol_block)
     """
-    pl = ProtocolLayer(raw=block.lines[:])
-    tokens: list[list[str]] = []
-    for ln in block.lines:
-        t = tokenize_line(ln)
-        if not t:
-            continue
-        tokens.append(t)
-
-    flat: list[str] = [tok for line in tokens for tok in line]
+    pl = ProtocolLayer(raw=_raw(block, keep_raw))
+    flat: list[str] = block.flat
 
     idx: int = 0
     if idx < len(flat):
@@ -849,7 +1587,7 @@ def parse_protocol_layer(block: A2LBlock) -> ProtocolLayer:
         if tok.startswith("BYTE_ORDER") or tok.startswith("ADDRESS_GRANULARITY") or tok == "OPTIONAL_CMD" or tok == "COMMUNICATION_MODE_SUPPORTED":
             break
         val = to_int(tok)
-        if val is not None:
+        if val is not None and -2**63 <= val < 2**63:
             pl.timing_values.append(val)
             idx += 1
             continue
@@ -857,44 +1595,34 @@ def parse_protocol_layer(block: A2LBlock) -> ProtocolLayer:
             idx += 1
             break
 
-    for i, tok in enumerate(flat):
-        if tok.startswith("BYTE_ORDER"):
-            pl.byte_order = tok
-        elif tok.startswith("ADDRESS_GRANULARITY"):
-            pl.address_granularity = tok
-        elif tok == "OPTIONAL_CMD" and i + 1 < len(flat):
-            pl.optional_cmds.append(flat[i + 1])
-        elif tok == "COMMUNICATION_MODE_SUPPORTED" and i + 1 < len(flat):
-            pl.communication_mode = flat[i + 1]
-        elif tok == "MASTER":
-            if i + 2 < len(flat):
-                pl.master_max_bs = to_int(flat[i + 1])
-                pl.master_min_st = to_int(flat[i + 2])
-
+    # Single pass: keyword dispatch plus the integers preceding the first enum token
     before_enum: list[int] = []
-    for tok in flat:
-        if tok.startswith("BYTE_ORDER") or tok.startswith("ADDRESS_GRANULARITY"):
-            break
-        v = to_int(tok)
-        if v is not None:
-            before_enum.append(v)
+    in_enums: bool = False
+    handlers_get = _PL_HANDLERS.get
+    for i, tok in enumerate(flat):
+        handler = handlers_get(tok)
+        if handler is not None:
+            handler(pl, flat, i)
+        elif tok.startswith(_PL_PREFIXES):
+            in_enums = True
+            if tok.startswith("BYTE_ORDER"):
+                pl.byte_order = _INTERN.get(tok, tok)
+            else:
+                pl.address_granularity = tok
+            continue
+        if not in_enums:
+            v = to_int(tok)
+            if v is not None:
+                before_enum.append(v)
     if len(before_enum) >= 3:
         pl.max_cto = before_enum[-3]
         pl.max_dto = before_enum[-2]
 
     return pl
 
-def parse_daq(block: A2LBlock) -> DaqConfig:
-    dq = DaqConfig(raw=block.lines[:])
-    lines: list[str] = block.lines[:]
-
-    toks: list[list[str]] = []
-    for ln in lines:
-        t = tokenize_line(ln)
-        if t:
-            toks.append(t)
-
-    flat: list[str] = [x for line in toks for x in line]
+def parse_daq(block: A2LBlock, keep_raw: bool = True) -> DaqConfig:
+    dq = DaqConfig(raw=_raw(block, keep_raw))
+    flat: list[str] = block.flat
 
     if flat:
         dq.mode = flat[0] if flat[0] in ("STATIC", "DYNAMIC") else None
@@ -903,64 +1631,55 @@ def parse_daq(block: A2LBlock) -> DaqConfig:
     if len(nums) >= 3:
         dq.max_daq, dq.max_event_channel, dq.min_daq = nums[:3]
 
+    handlers_get = _DAQ_HANDLERS.get
     for i, tok in enumerate(flat):
-        if tok.startswith("IDENTIFICATION_FIELD_TYPE_"):
+        handler = handlers_get(tok)
+        if handler is not None:
+            handler(dq, flat, i)
+        elif tok.startswith("IDENTIFICATION_FIELD_TYPE_"):
             dq.identification_field_type = tok
-        elif tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_DAQ_") or tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_DAQ"):
+        elif tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_DAQ"):
             dq.odt_entry_granularity_daq = tok
-        elif tok == "OVERLOAD_INDICATION_EVENT":
-            dq.overload_indication = "EVENT"
-        elif tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_STIM_"):
-            dq.stim_granularity = tok
-        elif tok == "BIT_STIM_SUPPORTED":
-            dq.bit_stim_supported = True
-
-    for i, tok in enumerate(flat):
-        if tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_DAQ"):
             if i + 1 < len(flat):
                 dq.max_odt_entry_size_daq = to_int(flat[i + 1])
-        if tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_STIM"):
+        elif tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_STIM"):
+            if tok.startswith("GRANULARITY_ODT_ENTRY_SIZE_STIM_"):
+                dq.stim_granularity = tok
             if i + 1 < len(flat):
                 dq.max_odt_entry_size_stim = to_int(flat[i + 1])
 
-    for evb in block.get_children("EVENT"):
-        dq.events.append(parse_daq_event(evb))
+    for evb in block.children_by_name.get("EVENT", ()):
+        dq.events.append(parse_daq_event(evb, keep_raw))
 
     return dq
 
-def parse_daq_event(block: A2LBlock) -> DaqEvent:
-    lines: list[str] = [ln for ln in block.lines if ln.strip()]
-    toks: list[list[str]] = [tokenize_line(ln) for ln in lines]
-    flat: list[str] = [x for line in toks for x in line]
-
-    quoted: list[str] = [unquote(x) for x in flat if (x.startswith('"') and x.endswith('"'))]
-    name: str = quoted[0] if quoted else ""
-    short: str | None = quoted[1] if len(quoted) > 1 else None
-
-    nums: list[int] = [x for x in [to_int(x) for x in flat] if x is not None]
-    evt_num: int | None = nums[0] if nums else None
-
+def parse_daq_event(block: A2LBlock, keep_raw: bool = True) -> DaqEvent:
+    # The first two tokens are the quoted channel name and short name; after
+    # them, a single pass finds the first integer (channel number), the event
+    # type, and the first four integers after the type
+    flat: list[str] = block.flat
+    name: str = flat[0] if flat else ""
+    short: str | None = flat[1] if len(flat) > 1 else None
+    evt_num: int | None = None
     type_tok: str | None = None
-    for x in flat:
-        if x in ("DAQ", "STIM", "DAQ_STIM"):
-            type_tok = x
-            break
+    seq: list[int] = []
+    for x in islice(flat, 2, None):
+        if type_tok is None and x in _DAQ_EVENT_TYPES:
+            type_tok = _INTERN[x]
+            continue
+        val = to_int(x)
+        if val is not None:
+            if evt_num is None:
+                evt_num = val
+            if type_tok is not None and len(seq) < 4:
+                seq.append(val)
 
+    max_daq_list: int | None = None
     cycle: int | None = None
     time_unit: int | None = None
     priority: int | None = None
-    max_daq_list: int | None = None
-    try:
-        ti: int = flat.index(type_tok)
-        seq: list[int] = []
-        for x in flat[ti+1:]:
-            val = to_int(x)
-            if val is not None:
-                seq.append(val)
-        if len(seq) >= 4:
-            max_daq_list, cycle, time_unit, priority = seq[:4]
-    except Exception:
-        pass
+    if len(seq) >= 4:
+        max_daq_list, cycle, time_unit, priority = seq
 
     return DaqEvent(
         name=name,
@@ -971,105 +1690,62 @@ def parse_daq_event(block: A2LBlock) -> DaqEvent:
         cycle=cycle,
         time_unit=time_unit,
         priority=priority,
-        raw=block.lines[:]
+        raw=_raw(block, keep_raw)
     )
 
-def parse_xcp_on_can(block: A2LBlock) -> XcpOnCanConfig:
-    xcp = XcpOnCanConfig(raw=block.lines[:])
-    lines: list[str] = block.lines[:]
-
-    toks: list[list[str]] = [tokenize_line(ln) for ln in lines if ln.strip()]
-    flat: list[str] = [x for line in toks for x in line]
+def parse_xcp_on_can(block: A2LBlock, keep_raw: bool = True) -> XcpOnCanConfig:
+    xcp = XcpOnCanConfig(raw=_raw(block, keep_raw))
+    flat: list[str] = block.flat
     if flat and to_int(flat[0]) is not None:
         xcp.version = to_int(flat[0])
 
-    kv_re: re.Pattern = re.compile(r"^([A-Z0-9_]+)\s+(\S+)$")
-    for ln in lines:
+    kv_match = _KV_RE.match
+    dispatch_get = _XCP_KEY_DISPATCH.get
+    for ln in block.lines:
         s = ln.strip()
-        m = kv_re.match(s)
+        m = kv_match(s)
         if not m:
             continue
         key: str = m.group(1)
         value: str = m.group(2)
-        key_u: str = key.upper()
-        if key_u == "CAN_ID_BROADCAST":
-            xcp.can_id_broadcast = to_int(value)
-        elif key_u == "CAN_ID_MASTER":
-            xcp.can_id_master = to_int(value)
-        elif key_u == "CAN_ID_SLAVE":
-            xcp.can_id_slave = to_int(value)
-        elif key_u == "CAN_ID_GET_DAQ_CLOCK_MULTICAST":
-            xcp.can_id_get_daq_clock_multicast = to_int(value)
-        elif key_u == "BAUDRATE":
-            xcp.baudrate = to_int(value)
-        elif key_u == "SAMPLE_POINT":
-            xcp.sample_point = to_int(value)
-        elif key_u == "SAMPLE_RATE":
-            xcp.sample_rate = value
-        elif key_u == "BTL_CYCLES":
-            xcp.btl_cycles = to_int(value)
-        elif key_u == "SJW":
-            xcp.sjw = to_int(value)
-        elif key_u == "SYNC_EDGE":
-            xcp.sync_edge = value
-        elif key_u == "MAX_DLC_REQUIRED":
-            xcp.max_dlc_required = True
-        elif key_u == "MAX_BUS_LOAD":
-            xcp.max_bus_load = to_int(value)
+        entry = dispatch_get(key)
+        if entry is not None:
+            attr, conv = entry
+            setattr(xcp, attr, conv(value))
 
     fd_block: A2LBlock | None = block.get_first_child("CAN_FD")
     if fd_block:
-        xcp.can_fd = parse_can_fd(fd_block)
+        xcp.can_fd = parse_can_fd(fd_block, keep_raw)
     return xcp
 
-def parse_can_fd(block: A2LBlock) -> XcpOnCanFdConfig:
-    fd = XcpOnCanFdConfig(raw=block.lines[:])
-    kv_re: re.Pattern = re.compile(r"^([A-Z0-9_]+)\s+(\S+)$")
+def parse_can_fd(block: A2LBlock, keep_raw: bool = True) -> XcpOnCanFdConfig:
+    fd = XcpOnCanFdConfig(raw=_raw(block, keep_raw))
+    kv_match = _KV_RE.match
+    dispatch_get = _CAN_FD_KEY_DISPATCH.get
     for ln in block.lines:
         s = ln.strip()
-        m = kv_re.match(s)
+        m = kv_match(s)
         if not m:
             continue
         key: str = m.group(1)
         value: str = m.group(2)
-        ku: str = key.upper()
-        if ku == "MAX_DLC":
-            fd.max_dlc = to_int(value)
-        elif ku == "CAN_FD_DATA_TRANSFER_BAUDRATE":
-            fd.data_transfer_baudrate = to_int(value)
-        elif ku == "SAMPLE_POINT":
-            fd.sample_point = to_int(value)
-        elif ku == "BTL_CYCLES":
-            fd.btl_cycles = to_int(value)
-        elif ku == "SJW":
-            fd.sjw = to_int(value)
-        elif ku == "SYNC_EDGE":
-            fd.sync_edge = value
-        elif ku == "MAX_DLC_REQUIRED":
-            fd.max_dlc_required = True
-        elif ku == "SECONDARY_SAMPLE_POINT":
-            fd.secondary_sample_point = to_int(value)
-        elif ku == "TRANSCEIVER_DELAY_COMPENSATION":
-            fd.tdc = value
+        entry = dispatch_get(key)
+        if entry is not None:
+            attr, conv = entry
+            setattr(fd, attr, conv(value))
     return fd
 
-def parse_segment_info(seg_block: A2LBlock) -> SegmentInfo:
-    si = SegmentInfo(raw=seg_block.lines[:])
-    toks: list[list[str]] = [tokenize_line(ln) for ln in seg_block.lines if ln.strip()]
-    flat: list[str] = [x for line in toks for x in line]
+def parse_segment_info(seg_block: A2LBlock, keep_raw: bool = True) -> SegmentInfo:
+    si = SegmentInfo(raw=_raw(seg_block, keep_raw))
+    flat: list[str] = seg_block.flat
     nums: list[int] = [x for x in [to_int(x) for x in flat] if x is not None]
     if len(nums) >= 5:
         si.segment_number, si.num_pages, si.address_extension, si.compression_method, si.encryption_method = nums[:5]
     cs: A2LBlock | None = seg_block.get_first_child("CHECKSUM")
-    if cs:
-        for ln in cs.lines:
-            t = tokenize_line(ln)
-            if t:
-                si.checksum_type = t[0]
-                break
-    for pg in seg_block.get_children("PAGE"):
-        page_tokens: list[list[str]] = [tokenize_line(ln) for ln in pg.lines if ln.strip()]
-        flatp: list[str] = [x for ln in page_tokens for x in ln]
+    if cs and cs.tokens:
+        si.checksum_type = cs.tokens[0][0]
+    for pg in seg_block.children_by_name.get("PAGE", ()):
+        flatp: list[str] = pg.flat
         pn: int | None = to_int(flatp[0]) if flatp else None
         ecu_acc: str | None = flatp[1] if len(flatp) > 1 else None
         xcp_rd: str | None = flatp[2] if len(flatp) > 2 else None
@@ -1077,7 +1753,7 @@ def parse_segment_info(seg_block: A2LBlock) -> SegmentInfo:
         si.pages.append(PageInfo(page_number=pn, ecu_access=ecu_acc, xcp_read_access=xcp_rd, xcp_write_access=xcp_wr))
     return si
 
-def parse_memory_segment(block: A2LBlock) -> MemorySegment:
+def parse_memory_segment(block: A2LBlock, keep_raw: bool = True) -> MemorySegment:
     name: str = block.args[0] if block.args else ""
     long_id: str | None = None
     if len(block.args) > 1:
@@ -1096,7 +1772,7 @@ def parse_memory_segment(block: A2LBlock) -> MemorySegment:
         if class_type is None and memory_type is None:
             tt: list[str] = tokenize_line(s)
             if len(tt) == 2 and tt[0].isalpha() and tt[1].isalpha():
-                class_type, memory_type = tt[0], tt[1]
+                class_type, memory_type = _INTERN.get(tt[0], tt[0]), _INTERN.get(tt[1], tt[1])
                 continue
         parts: list[str] = tokenize_line(s)
         if parts and (parts[0] in ("INTERN", "EXTERN")) and address is None:
@@ -1114,7 +1790,7 @@ def parse_memory_segment(block: A2LBlock) -> MemorySegment:
         if xcpp:
             segblk: A2LBlock | None = xcpp.get_first_child("SEGMENT")
             if segblk:
-                seg_info = parse_segment_info(segblk)
+                seg_info = parse_segment_info(segblk, keep_raw)
 
     return MemorySegment(
         name=name,
@@ -1125,90 +1801,109 @@ def parse_memory_segment(block: A2LBlock) -> MemorySegment:
         size=size,
         attributes=attrs,
         segment_info=seg_info,
-        raw=block.lines[:]
+        raw=_raw(block, keep_raw)
     )
-def parse_axis_pts(block: A2LBlock) -> AxisPts:
-    # Name can be in /begin line args or as the first line inside the block
-    lines: list[str] = [ln for ln in block.lines if ln.strip()]
-    i: int = 0
 
-    if block.args and len(block.args) > 0:
-        name: str = block.args[0]
-    else:
-        # First non-empty line is the name
-        first: list[str] = tokenize_line(lines[i]) if i < len(lines) else []
-        name: str = first[0] if first else ""
-        i += 1
 
-    def next_token_line() -> list[str]:
-        nonlocal i
-        while i < len(lines):
-            t: list[str] = tokenize_line(lines[i])
-            i += 1
-            if t:
-                return t
-        return []
+# Expression reading one field from the token list ``{t}`` of its line. Symbol
+# references (compu methods, record layouts, ...) repeat across thousands of
+# records and share one string per parse with the record names they refer to.
+_HEAD_CONVERTERS: Dict[str, str] = {
+    "desc": "_line_text({t})",
+    "sym": "_shared({t}[0])",
+    "enum": "_INTERN.get({t}[0], {t}[0])",
+    "int": "to_int({t}[0])",
+    "num": "_parse_num({t}[0])",
+}
+
+
+def _compile_head_reader(name: str, schema: Tuple[Tuple[str, str, Any], ...]) -> Callable[[list[list[str]]], tuple]:
+    """
+    Generate a straight-line reader for the fixed-position lines at the start of a block.
+
+    Each ``(field, kind, default)`` schema entry consumes one non-empty line and
+    converts it according to ``kind`` (see ``_HEAD_CONVERTERS``), or yields
+    ``default`` if the block has run out of lines. The generated function takes
+    the block's tokenized lines (minus any name line) and returns the values as a tuple.
+
+    Example:
+        >>> read = _compile_head_reader("read", (("address", "int", None), ("unit", "sym", "")))
+        >>> read([["0x10"], ["V"]]), read([["0x10"]])
+        ((16, 'V'), (16, ''))
+    """
+    body = [f"def {name}(tl):", "    n = len(tl)", "    return ("]
+    for j, (fld, kind, default) in enumerate(schema):
+        expr = _HEAD_CONVERTERS[kind].format(t=f"tl[{j}]")
+        body.append(f"        {expr} if n > {j} else {default!r},  # {fld}")
+    body.append("    )")
+    namespace: Dict[str, Any] = {}
+    exec(compile("\n".join(body), f"<a2l head reader {name}>", "exec"), globals(), namespace)
+    return cast("Callable[[list[list[str]]], tuple]", namespace[name])
+_AXIS_PTS_HEAD = (
+    ("description", "desc", ""),
+    ("address", "int", None),
+    ("input_quantity", "sym", None),
+    ("record_layout", "sym", None),
+    ("deposit", "int", None),
+    ("compu_method", "sym", None),
+    ("max_axis_points", "int", None),
+    ("lower_limit", "num", None),
+    ("upper_limit", "num", None),
+)
+_MEASUREMENT_HEAD = (
+    ("description", "desc", ""),
+    ("datatype", "enum", ""),
+    ("compu_method", "sym", ""),
+)
+_CHARACTERISTIC_HEAD = (
+    ("description", "desc", ""),
+    ("char_type", "enum", ""),
+    ("address", "int", None),
+    ("record_layout", "sym", None),
+    ("max_diff", "num", None),
+    ("compu_method", "sym", None),
+    ("lower_limit", "num", None),
+    ("upper_limit", "num", None),
+)
+_read_axis_pts_head = _compile_head_reader("_read_axis_pts_head", _AXIS_PTS_HEAD)
+_read_measurement_head = _compile_head_reader("_read_measurement_head", _MEASUREMENT_HEAD)
+_read_characteristic_head = _compile_head_reader("_read_characteristic_head", _CHARACTERISTIC_HEAD)
+
+
+def _name_and_lines(block: A2LBlock) -> Tuple[str, list[list[str]]]:
+    """
+    Block name from the /begin args, else from the first content line (which is then skipped).
+
+    The tokenized lines are built locally rather than through the cached
+    ``A2LBlock.tokens``: keeping them alive on every block costs more in
+    garbage-collector passes than it saves.
+    """
+    tl = [t for t in map(tokenize_line, block.lines) if t]
+    if block.args:
+        return block.args[0], tl
+    return (tl[0][0] if tl else ""), tl[1:]
+
 
-    # Description
-    desc_tokens: list[str] = next_token_line()
-    description: str = unquote(" ".join(desc_tokens)) if desc_tokens else ""
-
-    # Address
-    addr: int | None = None
-    t: list[str] = next_token_line()
-    if t:
-        addr = to_int(t[0])
-
-    input_qty: str | None = None
-    t = next_token_line()
-    if t:
-        input_qty = t[0]
-
-    record_layout: str | None = None
-    t = next_token_line()
-    if t:
-        record_layout = t[0]
-
-    deposit: int | None = None
-    t = next_token_line()
-    if t:
-        deposit = to_int(t[0])
-
-    compu_method: str | None = None
-    t = next_token_line()
-    if t:
-        compu_method = t[0]
-
-    max_points: int | None = None
-    t = next_token_line()
-    if t:
-        max_points = to_int(t[0])
-
-    lower: float | int | None = None
-    upper: float | int | None = None
-    t = next_token_line()
-    if t:
-        lower = to_float(t[0]) if to_float(t[0]) is not None else to_int(t[0])
-    t = next_token_line()
-    if t:
-        upper = to_float(t[0]) if to_float(t[0]) is not None else to_int(t[0])
+def parse_axis_pts(block: A2LBlock, keep_raw: bool = True) -> AxisPts:
+    # Name can be in /begin line args or as the first line inside the block
+    name, tl = _name_and_lines(block)
+    (description, addr, input_qty, record_layout, deposit,
+     compu_method, max_points, lower, upper) = _read_axis_pts_head(tl)
 
     # Optional: BYTE_ORDER, FORMAT, IF_DATA, SYMBOL_LINK, etc.
     byte_order: str | None = None
     fmt: str | None = None
     symbol_link: tuple[str | None, int | None] | None = None
 
-    for ln in lines[i:]:
-        tt: list[str] = tokenize_line(ln)
-        if not tt:
-            continue
-        if tt[0].upper() == "BYTE_ORDER":
+    for tt in tl[len(_AXIS_PTS_HEAD):]:
+        key = tt[0]
+        if key == "BYTE_ORDER":
             if len(tt) > 1:
-                byte_order = tt[1]
-        elif tt[0].upper() == "FORMAT":
+                byte_order = _INTERN.get(tt[1], tt[1])
+        elif key == "FORMAT":
             if len(tt) > 1:
                 fmt = tt[1]
-        elif tt[0].upper() == "SYMBOL_LINK":
+        elif key == "SYMBOL_LINK":
             # SYMBOL_LINK "name" index
             if len(tt) >= 3:
                 symbol_link = (unquote(tt[1]), to_int(tt[2]) or 0)
@@ -1227,34 +1922,14 @@ def parse_axis_pts(block: A2LBlock) -> AxisPts:
         byte_order=byte_order,
         format_str=fmt,
         symbol_link=symbol_link,
-        raw=block.lines[:]
+        raw=_raw(block, keep_raw)
     )
 
 
-def parse_measurement(block: A2LBlock) -> Measurement:
+def parse_measurement(block: A2LBlock, keep_raw: bool = True) -> Measurement:
     # Name can be in /begin args or first line inside the block
-    lines = [ln for ln in block.lines if ln.strip()]
-    i = 0
-
-    if block.args and len(block.args) > 0:
-        name = block.args[0]
-    else:
-        t0 = tokenize_line(lines[i]) if i < len(lines) else []
-        name = t0[0] if t0 else ""
-        i += 1  # advance past the name line
-
-    def next_tokens()->list[Any]:
-        nonlocal i
-        while i < len(lines):
-            t = tokenize_line(lines[i])
-            i += 1
-            if t:
-                return t
-        return []
-
-    desc = unquote(" ".join(next_tokens())) if i < len(lines) else ""
-    datatype = next_tokens()[0] if i < len(lines) else ""
-    compu_method = next_tokens()[0] if i < len(lines) else ""
+    name, tl = _name_and_lines(block)
+    desc, datatype, compu_method = _read_measurement_head(tl)
 
     params: list[str] = []
     ecu_address = None
@@ -1263,12 +1938,8 @@ def parse_measurement(block: A2LBlock) -> Measurement:
     upper = None
     symbol_link = None
 
-    while i < len(lines):
-        t = tokenize_line(lines[i])
-        i += 1
-        if not t:
-            continue
-        key = t[0].upper()
+    for t in tl[len(_MEASUREMENT_HEAD):]:
+        key = t[0]
         if key in ("ECU_ADDRESS", "ADDRESS"):
             if len(t) > 1:
                 val = to_int(t[1])
@@ -1280,14 +1951,14 @@ def parse_measurement(block: A2LBlock) -> Measurement:
             if len(t) >= 3:
                 symbol_link = (unquote(t[1]), to_int(t[2]) or 0)
         else:
-            # numeric params, limits, or other tokens
-            if len(t) == 1 and (to_int(t[0]) is not None or to_float(t[0]) is not None):
-                params.append(t[0])
-            elif len(t) == 2 and all([(to_float(x) is not None or to_int(x) is not None) for x in t]):
-                lower = to_float(t[0]) if to_float(t[0]) is not None else to_int(t[0])
-                upper = to_float(t[1]) if to_float(t[1]) is not None else to_int(t[1])
-            else:
-                params.extend(t)
+            # numeric params, limits, or other tokens; only a two-number line is a limit pair
+            if len(t) == 2:
+                a = _parse_num(t[0])
+                b = _parse_num(t[1])
+                if a is not None and b is not None:
+                    lower, upper = a, b
+                    continue
+            params.extend(t)
 
     return Measurement(
         name=name,
@@ -1300,11 +1971,11 @@ def parse_measurement(block: A2LBlock) -> Measurement:
         lower_limit=lower,
         upper_limit=upper,
         symbol_link=symbol_link,
-        raw=block.lines[:]
+        raw=_raw(block, keep_raw)
     )
 
 
-def parse_characteristic(block: A2LBlock) -> Characteristic:
+def parse_characteristic(block: A2LBlock, keep_raw: bool = True) -> Characteristic:
     """
     CHARACTERISTIC name on first content line when absent from /begin.
     Then:
@@ -1318,63 +1989,13 @@ def parse_characteristic(block: A2LBlock) -> Characteristic:
       <upper>
     Optional SYMBOL_LINK lines may follow.
     """
-    lines: list[str] = [ln for ln in block.lines if ln.strip()]
-    i: int = 0
-
-    if block.args and len(block.args) > 0:
-        name: str = block.args[0]
-    else:
-        t0: list[str] = tokenize_line(lines[i]) if i < len(lines) else []
-        name: str = t0[0] if t0 else ""
-        i += 1  # advance past name
-
-    def next_tokens() -> list[str]:
-        nonlocal i
-        while i < len(lines):
-            t: list[str] = tokenize_line(lines[i])
-            i += 1
-            if t:
-                return t
-        return []
-
-    desc: str = unquote(" ".join(next_tokens())) if i < len(lines) else ""
-    char_type: str = next_tokens()[0] if i < len(lines) else ""
-
-    addr: int | None = None
-    t: list[str] = next_tokens()
-    if t:
-        addr = to_int(t[0])
-
-    record_layout: str | None = None
-    t = next_tokens()
-    if t:
-        record_layout = t[0]
-
-    max_diff: float | int | None = None
-    t = next_tokens()
-    if t:
-        max_diff = to_float(t[0]) if to_float(t[0]) is not None else to_int(t[0])
-
-    compu_method: str | None = None
-    t = next_tokens()
-    if t:
-        compu_method = t[0]
-
-    lower: float | int | None = None
-    upper: float | int | None = None
-    t = next_tokens()
-    if t:
-        lower = to_float(t[0]) if to_float(t[0]) is not None else to_int(t[0])
-    t = next_tokens()
-    if t:
-        upper = to_float(t[0]) if to_float(t[0]) is not None else to_int(t[0])
+    name, tl = _name_and_lines(block)
+    (desc, char_type, addr, record_layout, max_diff,
+     compu_method, lower, upper) = _read_characteristic_head(tl)
 
     symbol_link: tuple[str | None, int | None] | None = None
-    for ln in lines[i:]:
-        tt: list[str] = tokenize_line(ln)
-        if not tt:
-            continue
-        if tt[0].upper() == "SYMBOL_LINK" and len(tt) >= 3:
+    for tt in tl[len(_CHARACTERISTIC_HEAD):]:
+        if tt[0] == "SYMBOL_LINK" and len(tt) >= 3:
             symbol_link = (unquote(tt[1]), to_int(tt[2]) or 0)
 
     return Characteristic(
@@ -1388,12 +2009,12 @@ def parse_characteristic(block: A2LBlock) -> Characteristic:
         lower_limit=lower,
         upper_limit=upper,
         symbol_link=symbol_link,
-        raw=block.lines[:]
+        raw=_raw(block, keep_raw)
     )
 
-def parse_compu_method(block: A2LBlock) -> CompuMethod:
+def parse_compu_method(block: A2LBlock, keep_raw: bool = True) -> CompuMethod:
     name: str = block.args[0] if block.args else ""
-    lines: list[str] = [ln for ln in block.lines if ln.strip()]
+    lines: list[str] = block.lines
     i: int = 0
     def next_tokens() -> list[str]:
         nonlocal i
@@ -1404,24 +2025,30 @@ def parse_compu_method(block: A2LBlock) -> CompuMethod:
                 return t
         return []
 
-    desc: str = unquote(" ".join(next_tokens())) if lines else ""
+    desc: str = _line_text(next_tokens()) if lines else ""
     method_type: str = next_tokens()[0] if lines else ""
-    fmt: str | None = unquote(" ".join(next_tokens())) if lines else None
-    unit: str | None = unquote(" ".join(next_tokens())) if lines else None
-    coeffs: list[float] = []
+    method_type = _INTERN.get(method_type, method_type)
+    fmt: str | None = _line_text(next_tokens()) if lines else None
+    unit: str | None = _line_text(next_tokens()) if lines else None
+    coeffs = array("d")
     for ln in lines[i:]:
         tt: list[str] = tokenize_line(ln)
         if not tt:
             continue
-        if tt[0].upper() == "COEFFS":
+        if tt[0] == "COEFFS":
             for v in tt[1:]:
-                if to_float(v) is not None:
-                    coeffs.append(float(v))
-    return CompuMethod(name=name, description=desc, method_type=method_type, format_str=fmt, unit=unit, coeffs=coeffs, raw=block.lines[:])
+                c = to_float(v)
+                if c is not None:
+                    coeffs.append(c)
+    return CompuMethod(name=name, description=desc, method_type=method_type, format_str=fmt, unit=unit, coeffs=coeffs, raw=_raw(block, keep_raw))
+
+# One COMPU_VTAB row holding a decimal value and a quoted verb, which tokenize_line,
+# to_int and unquote would read as exactly (int(group 1), group 2)
+_VTAB_ROW_RE = re.compile(r'^[ \t\r]*(-?[0-9]+)[ \t\r]+"([^"\\\']*)"[ \t\r]*$', re.M)
 
-def parse_compu_vtab(block: A2LBlock) -> CompuVTab:
+def parse_compu_vtab(block: A2LBlock, keep_raw: bool = True) -> CompuVTab:
     name: str = block.args[0] if block.args else ""
-    lines: list[str] = [ln for ln in block.lines if ln.strip()]
+    lines: list[str] = block.lines
     i: int = 0
     def next_tokens() -> list[str]:
         nonlocal i
@@ -1432,80 +2059,173 @@ def parse_compu_vtab(block: A2LBlock) -> CompuVTab:
                 return t
         return []
 
-    desc: str = unquote(" ".join(next_tokens())) if lines else ""
+    desc: str = _line_text(next_tokens()) if lines else ""
     tab_type: str = next_tokens()[0] if lines else ""
+    tab_type = _INTERN.get(tab_type, tab_type)
     entries: list[Tuple[int, str]] = []
-    count: int | None = None
     t: list[str] = next_tokens()
-    if t and to_int(t[0]) is not None:
-        count = to_int(t[0])
-        for _ in range(count or 0):
-            tt: list[str] = next_tokens()
-            if not tt:
-                continue
+    count: int | None = to_int(t[0]) if t else None
+    # entry rows: the `count` lines after the count, or all remaining lines without one
+    rows: list[str] = lines[i:i + max(count, 0)] if count is not None else lines[i:]
+    found: list[Tuple[str, str]] = _VTAB_ROW_RE.findall("\n".join(rows))
+    if len(found) == len(rows):
+        # every row is a plain `value "verb"` pair: one regex pass over all of them
+        entries = [(int(v), verb) for v, verb in found]
+    else:
+        for ln in rows:
+            tt: list[str] = tokenize_line(ln)
             val: int | None = to_int(tt[0])
-            verb: str = unquote(" ".join(tt[1:])) if len(tt) > 1 else ""
             if val is not None:
-                entries.append((val, verb.strip('"')))
-    else:
-        while True:
-            tt: list[str] = next_tokens()
-            if not tt:
-                break
-            try:
-                val: int | None = to_int(tt[0])
                 verb: str = unquote(" ".join(tt[1:]))
-                if val is not None:
-                    entries.append((val, verb))
-            except Exception:
-                break
+                entries.append((val, verb.strip('"') if count is not None else verb))
 
-    return CompuVTab(name=name, description=desc, tab_type=tab_type, entries=entries, raw=block.lines[:])
+    return CompuVTab(name=name, description=desc, tab_type=tab_type, entries=entries, raw=_raw(block, keep_raw))
 
-def parse_record_layout(block: A2LBlock) -> RecordLayout:
+def parse_record_layout(block: A2LBlock, keep_raw: bool = True) -> RecordLayout:
     name: str = block.args[0] if block.args else ""
-    entries: list[str] = [ln.strip() for ln in block.lines if ln.strip()]
-    return RecordLayout(name=name, entries=entries, raw=block.lines[:])
+    entries: list[str] = [ln.strip() for ln in block.lines]
+    return RecordLayout(name=name, entries=entries, raw=_raw(block, keep_raw))
 
-def parse_group(block: A2LBlock) -> Group:
+def parse_group(block: A2LBlock, keep_raw: bool = True) -> Group:
     name = block.args[0] if block.args else ""
-    lines = [ln for ln in block.lines if ln.strip()]
+    lines = block.lines
     desc = ""
     refs: list[str] = []
     if lines:
-        t = tokenize_line(lines[0])
-        if t:
-            desc = unquote(" ".join(t))
-    for rb in block.get_children("REF_MEASUREMENT"):
+        desc = _line_description(lines[0])
+    for rb in block.children_by_name.get("REF_MEASUREMENT", ()):
         for ln in rb.lines:
             t = tokenize_line(ln)
             for tok in t:
                 if tok not in ("/begin", "/end"):
                     refs.append(tok)
-    return Group(name=name, description=desc, ref_measurements=refs, raw=block.lines[:])
+    return Group(name=name, description=desc, ref_measurements=refs, raw=_raw(block, keep_raw))
 
-def parse_function(block: A2LBlock) -> Function:
+def parse_function(block: A2LBlock, keep_raw: bool = True) -> Function:
     name = block.args[0] if block.args else ""
-    lines = [ln for ln in block.lines if ln.strip()]
+    lines = block.lines
     desc = ""
     loc: list[str] = []
     if lines:
-        t = tokenize_line(lines[0])
-        if t:
-            desc = unquote(" ".join(t))
-    for lb in block.get_children("LOC_MEASUREMENT"):
+        desc = _line_description(lines[0])
+    for lb in block.children_by_name.get("LOC_MEASUREMENT", ()):
         for ln in lb.lines:
             t = tokenize_line(ln)
             for tok in t:
                 loc.append(tok)
     loc = [x for x in loc if x not in ("/begin", "/end")]
-    return Function(name=name, description=desc, loc_measurements=loc, raw=block.lines[:])
+    return Function(name=name, description=desc, loc_measurements=loc, raw=_raw(block, keep_raw))
+
+
+def _share_identical(rec: Any, key: Tuple[Any, ...], seen: Dict[Tuple[Any, ...], Any], attrs: Tuple[str, ...],
+                     reused: Container[int] = ()) -> Any:
+    """
+    Make ``rec`` reuse the field values of the first record seen with the same ``key``.
+
+    Generated A2Ls repeat a handful of COMPU_METHOD / RECORD_LAYOUT bodies
+    thousands of times under different names. Each record keeps its own name
+    and its own list objects, so editing one never affects another, but the
+    strings and numbers inside are shared with the first occurrence. Records
+    whose id is in ``reused`` were taken over from a prior model, which still
+    holds them, and are left unchanged.
+    """
+    first = seen.setdefault(key, rec)
+    if first is not rec and id(rec) not in reused:
+        for attr in attrs:
+            value = getattr(first, attr)
+            setattr(rec, attr, value[:] if isinstance(value, (list, array)) else value)
+    return rec
+
+def _parse_once_per_body(parse: Callable[[A2LBlock, bool], Any]) -> Callable[[A2LBlock, bool], Any]:
+    """
+    Wrap a record parser so that blocks with identical lines are parsed only once.
+
+    A later block with the same lines as an earlier one gets a copy of the
+    earlier record with its own name and ``raw``; its list fields are still
+    the earlier record's until ``_share_identical`` gives it copies. The cache
+    lives as long as the returned function, i.e. one parse.
+    """
+    first_by_lines: Dict[Tuple[str, ...], Any] = {}
+
+    @wraps(parse)
+    def parse_once(block: A2LBlock, keep_raw: bool = True) -> Any:
+        key = tuple(block.lines)
+        first = first_by_lines.get(key)
+        if first is None:
+            first = first_by_lines[key] = parse(block, keep_raw)
+            return first
+        rec = copy.copy(first)
+        rec.name = block.args[0] if block.args else ""
+        rec.raw = _raw(block, keep_raw)
+        return rec
+    return parse_once
+
+
+# Record kinds that A2LParser(workers > 1) parses in a process pool, and the
+# number of blocks of one kind below which pickling costs more than it saves
+_PARALLEL_TAGS = ("AXIS_PTS", "MEASUREMENT", "CHARACTERISTIC", "COMPU_METHOD", "COMPU_VTAB")
+_PARALLEL_MIN_BLOCKS = 5000
+
+
+# Record kinds directly inside MODULE, in the order the model lists are filled
+_RECORD_PARSERS: Dict[str, Callable[[A2LBlock, bool], Any]] = {
+    "AXIS_PTS": parse_axis_pts,
+    "MEASUREMENT": parse_measurement,
+    "CHARACTERISTIC": parse_characteristic,
+    "COMPU_METHOD": parse_compu_method,
+    "COMPU_VTAB": parse_compu_vtab,
+    "RECORD_LAYOUT": parse_record_layout,
+    "GROUP": parse_group,
+    "FUNCTION": parse_function,
+}
+
+def _record_parsers() -> Dict[str, Callable[[A2LBlock, bool], Any]]:
+    """``_RECORD_PARSERS`` for one parse, with the often repeated COMPU_METHOD / RECORD_LAYOUT bodies parsed once each."""
+    parsers = dict(_RECORD_PARSERS)
+    parsers["COMPU_METHOD"] = _parse_once_per_body(parse_compu_method)
+    parsers["RECORD_LAYOUT"] = _parse_once_per_body(parse_record_layout)
+    return parsers
+
+
+@_sharing_strings()
+def _parse_blocks(parse: Callable[[A2LBlock, bool], Any], blocks: list[A2LBlock], keep_raw: bool) -> list[Any]:
+    """Parse a chunk of same-kind blocks (process pool entry point)."""
+    return [parse(b, keep_raw) for b in blocks]
 
 
 # --------------------------
 # A2L file block parser (generic tree)
 # --------------------------
 
+_BEGIN_MATCH = re.compile(r"/begin\s+(\S+)\s*(.*)$", re.I).match
+
+# /begin arguments made only of bare words and escape-free "..." strings separated
+# by shlex whitespace; for these a regex split gives exactly the shlex result
+_SIMPLE_ARG = r'(?:"[^"\'\\]*"|[^\s"\'\\]+)'
+_SIMPLE_ARGS_MATCH = re.compile(rf"{_SIMPLE_ARG}(?:[ \t\r\n]+{_SIMPLE_ARG})*").fullmatch
+_ARG_FINDALL = re.compile(r'"([^"]*)"|(\S+)').findall
+
+
+def _split_args(args_str: str) -> list[str]:
+    """
+    Split the argument text of a /begin line like ``shlex.split(args_str, posix=True)``.
+
+    Bare words and plain double-quoted strings, which is all real A2L files
+    use there, are split with a regex; anything involving single quotes,
+    backslashes, adjacent quoted parts or unusual whitespace goes through
+    shlex, falling back to a whitespace split for unbalanced quotes.
+
+    Example:
+        >>> _split_args('NAME "Long description" 0x10')
+        ['NAME', 'Long description', '0x10']
+    """
+    if _SIMPLE_ARGS_MATCH(args_str):
+        return [bare or quoted for quoted, bare in _ARG_FINDALL(args_str)]
+    try:
+        return shlex.split(args_str, posix=True)
+    except Exception:
+        return args_str.split()
+
 class BlockBuilder:
     """
     Builds A2L block hierarchy from raw text lines.
@@ -1513,39 +2233,71 @@ class BlockBuilder:
     This class processes A2L text line by line and builds a hierarchical
     block structure that represents the A2L file's organization.
     """
-    def __init__(self) -> None:
-        """Initialize the BlockBuilder with an empty root block."""
+    def __init__(self, record_handlers: Dict[str, Callable[[A2LBlock], None]] | None = None) -> None:
+        """
+        Initialize the BlockBuilder with an empty root block.
+
+        Args:
+            record_handlers: Upper-case block name -> callback. Blocks with one
+                of these names directly inside the first MODULE of the first
+                PROJECT are handed to the callback as soon as they end, instead
+                of being added to the tree.
+        """
         self.root = A2LBlock(name="ROOT", args=[])
         self.stack = [self.root]
+        self.record_handlers = record_handlers or {}
+        # The first MODULE of the first PROJECT once opened, and the record block being streamed
+        self._record_parent: A2LBlock | None = None
+        self._record: A2LBlock | None = None
 
     def feed_line(self, line: str) -> None:
         s = line.strip()
         if not s:
             return
-        if s.lower().startswith("/begin"):
-            m = re.match(r"/begin\s+(\S+)\s*(.*)$", s, flags=re.I)
+        if s[:1] != "/":
+            # Neither /begin nor /end: the common case
+            self.stack[-1].lines.append(line.rstrip("\n"))
+            return
+        if s[:6].lower() == "/begin":
+            m = _BEGIN_MATCH(s)
             if not m:
                 self.stack[-1].lines.append(line.rstrip("\n"))
                 return
-            name = m.group(1)
-            if name == "MEASUREMENT":
-                pass
+            # Block names (keywords) recur as dict keys and are interned; the
+            # record names in args[0] are referenced from other records and
+            # share one str object per parse
+            name = sys.intern(m.group(1))
             args_str = m.group(2).strip()
-            args = []
-            if args_str:
-                try:
-                    args = shlex.split(args_str, posix=True)
-                except Exception:
-                    args = args_str.split()
+            args = _split_args(args_str) if args_str else []
+            if args:
+                args[0] = _shared(args[0])
             blk = A2LBlock(name=name, args=args, lines=[], children=[])
-            self.stack[-1].children.append(blk)
+            parent = self.stack[-1]
+            if parent is self._record_parent and name.upper() in self.record_handlers:
+                self._record = blk
+            else:
+                parent.children.append(blk)
+                if (self._record_parent is None and self.record_handlers and len(self.stack) == 2
+                        and name.upper() == "MODULE" and parent is self.root.get_first_child("PROJECT")):
+                    self._record_parent = blk
             self.stack.append(blk)
-        elif s.lower().startswith("/end"):
+        elif s[:4].lower() == "/end":
             if len(self.stack) > 1:
-                self.stack.pop()
+                if self.stack.pop() is self._record:
+                    self._emit_record()
         else:
             self.stack[-1].lines.append(line.rstrip("\n"))
 
+    def _emit_record(self) -> None:
+        blk, self._record = self._record, None
+        assert blk is not None
+        self.record_handlers[blk.name.upper()](blk)
+
+    def close(self) -> None:
+        """Hand a record block still open at the end of the input to its handler."""
+        if self._record is not None:
+            self._emit_record()
+
     def get_root(self) -> A2LBlock:
         return self.root
 
@@ -1554,6 +2306,64 @@ class BlockBuilder:
 # Top-level parser
 # --------------------------
 
+def _common_prefix_len(a: str, b: str) -> int:
+    """Length of the longest common prefix of ``a`` and ``b``, compared in slices."""
+    n = min(len(a), len(b))
+    i = 0
+    while i + 4096 <= n and a[i:i + 4096] == b[i:i + 4096]:
+        i += 4096
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+def _common_suffix_len(a: str, b: str, limit: int) -> int:
+    """Length of the longest common suffix of ``a`` and ``b``, at most ``limit``."""
+    la, lb = len(a), len(b)
+    i = 0
+    while i + 4096 <= limit and a[la - i - 4096:la - i] == b[lb - i - 4096:lb - i]:
+        i += 4096
+    while i < limit and a[la - i - 1] == b[lb - i - 1]:
+        i += 1
+    return i
+
+def _ends_in_comment(text: str, pos: int, end: int) -> bool:
+    """Whether ``text[pos:end]`` leaves a block comment open that ``text`` closes later, read as ``_iter_uncommented`` does."""
+    while True:
+        start = text.find("/*", pos, end)
+        if start < 0:
+            return False
+        pos = text.find("*/", start + 2, end) + 2
+        if pos < 2:
+            # a "/*" never closed is no comment
+            return text.find("*/", max(start + 2, end - 1)) >= 0
+
+def _reusable_spans(prior: A2LModel | None, text: str) -> Iterator[Tuple[int, int, str, Any]]:
+    """
+    Record spans of ``prior`` that ``text`` contains unchanged, moved to their offsets in ``text``.
+
+    A span qualifies when it lies in the common prefix or suffix of the old
+    and new text, still starts and ends at a line boundary, and holds no
+    block comment marker (so that no comment can reach into or out of it).
+    """
+    if prior is None or prior._source is None:
+        return
+    old = prior._source
+    head = _common_prefix_len(old, text)
+    tail_start = len(old) - _common_suffix_len(old, text, min(len(old), len(text)) - head)
+    shift = len(text) - len(old)
+    for start, end, tag, rec in prior._spans:
+        if end <= head:
+            new_start, new_end = start, end
+        elif start >= tail_start:
+            new_start, new_end = start + shift, end + shift
+        else:
+            continue
+        if ((new_start == 0 or text[new_start - 1] in "\r\n")
+                and (new_end == len(text) or text[new_end] in "\r\n")
+                and old.find("/*", start, end) < 0 and old.find("*/", start, end) < 0):
+            yield new_start, new_end, tag, rec
+
+
 class A2LParser:
     """
     Main A2L parser class that converts A2L text into structured data model.
@@ -1561,6 +2371,42 @@ class A2LParser:
     This class handles the complete parsing process from raw A2L text to
     a structured A2LModel object containing all parsed elements.
     """
+    def __init__(self, keep_raw: bool = False, workers: int = 1, encoding: str = "utf-8",
+                 incremental: bool = False) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            keep_raw: Keep the source lines of each parsed block in the records'
+                ``raw`` fields and the generic block tree in ``A2LModel.raw_blocks``.
+                Off by default, as it roughly doubles the memory held by a model.
+            workers: Number of processes used to parse the records of large
+                modules (``_PARALLEL_MIN_BLOCKS`` or more blocks of one kind).
+                The default of 1 parses everything in the calling process; with
+                more, the calling script needs an ``if __name__ == "__main__"``
+                guard on platforms that spawn worker processes.
+            encoding: Text encoding used by ``parse_file``; undecodable bytes
+                are dropped. Older A2L files are often ``"latin-1"``. Files are
+                decoded in blocks cut at line break bytes, so the encoding must be
+                ASCII-compatible; UTF-16 and UTF-32 are not supported.
+            incremental: Keep the source text and record positions in the models
+                returned by ``parse_text``, so that a later ``parse_text(text,
+                prior=model)`` re-parses only the records of edited lines. The
+                models then hold on to their source text. Not combinable with
+                ``keep_raw``; records are parsed in the calling process.
+
+        Raises:
+            ValueError: If both ``keep_raw`` and ``incremental`` are set, or if
+                the encoding is not ASCII-compatible
+        """
+        if keep_raw and incremental:
+            raise ValueError("incremental parsing does not keep the raw block tree")
+        _check_encoding(encoding)
+        self.keep_raw = keep_raw
+        self.workers = workers
+        self.encoding = encoding
+        self.incremental = incremental
+
     def parse_file(self, path: str | Path) -> A2LModel:
         """
         Parse an A2L file from disk.
@@ -1574,17 +2420,174 @@ class A2LParser:
         Raises:
             IOError: If the file cannot be read
         """
-        text = Path(path).read_text(encoding="utf-8", errors="ignore")
-        return self.parse_text(text)
+        return self._parse_lines(iter_lines_no_comments(path, self.encoding))
+
+    def parse_text(self, text: str, prior: A2LModel | None = None) -> A2LModel:
+        """
+        Parse A2L content from a string.
+
+        Args:
+            text: A2L content
+            prior: A model returned for an earlier version of the text by a
+                parser with ``incremental=True``. MODULE records whose lines lie
+                in the unchanged start or end of the text are taken over from it
+                (the objects are shared with ``prior``) instead of being parsed.
+
+        Returns:
+            A2LModel object containing parsed data
+
+        Raises:
+            ValueError: If ``prior`` is given to a parser without ``incremental``
+        """
+        if self.incremental:
+            return self._parse_incremental(text, prior)
+        if prior is not None:
+            raise ValueError("parse_text(prior=...) needs A2LParser(incremental=True)")
+        return self._parse_lines(iter_text_lines_no_comments(text))
+
+    def parse_files(self, paths: Iterable[str | Path]) -> list[A2LModel]:
+        """
+        Parse several A2L files, e.g. all inputs of a toolchain run.
+
+        With ``workers`` > 1 the files are parsed concurrently, one file per
+        worker process at a time, and the models are returned by pickling;
+        each file is then parsed serially within its worker.
+
+        Args:
+            paths: Paths of the A2L files to parse
+
+        Returns:
+            One A2LModel per path, in the order of ``paths``
+        """
+        paths = list(paths)
+        if self.workers <= 1 or len(paths) < 2:
+            return [self.parse_file(p) for p in paths]
+        per_file = A2LParser(keep_raw=self.keep_raw, encoding=self.encoding)
+        with ProcessPoolExecutor(min(self.workers, len(paths))) as pool:
+            return list(pool.map(per_file.parse_file, paths))
+
+    def _pool(self, mod: A2LBlock) -> Any:
+        """Process pool for the record lists of ``mod``, or a no-op context when not worth it."""
+        if self.workers > 1 and any(len(mod.children_by_name.get(tag, ())) >= _PARALLEL_MIN_BLOCKS for tag in _PARALLEL_TAGS):
+            return ProcessPoolExecutor(self.workers)
+        return nullcontext()
+
+    def _parse_many(self, parse: Callable[[A2LBlock, bool], Any], blocks: Sequence[A2LBlock],
+                    pool: ProcessPoolExecutor | None) -> Iterable[list[Any]]:
+        """
+        Parse same-kind blocks, split into chunks across ``pool`` when there are enough of them.
 
-    def parse_text(self, text: str) -> A2LModel:
-        cleaned = strip_block_comments(text)
-        bb = BlockBuilder()
-        for ln in cleaned.splitlines():
+        Pooled chunks are submitted right away and their results come back
+        lazily, in order, so the caller can start every kind before waiting.
+        """
+        if pool is None or len(blocks) < _PARALLEL_MIN_BLOCKS:
+            return ([parse(b, self.keep_raw) for b in blocks],)
+        size = -(-len(blocks) // (self.workers * 4))
+        chunks = [blocks[i:i + size] for i in range(0, len(blocks), size)]
+        # workers get the plain parse function, as its per-parse cache cannot be pickled
+        return pool.map(_parse_blocks, repeat(getattr(parse, "__wrapped__", parse)), chunks, repeat(self.keep_raw))
+
+    @_sharing_strings()
+    def _parse_lines(self, lines: Iterable[str]) -> A2LModel:
+        keep_raw = self.keep_raw
+        # Record kind -> parsed records. Unless the tree is kept or parsed in a
+        # pool, module-level records are parsed as soon as they end and never
+        # attached to the tree.
+        records: Dict[str, list[Any]] = {}
+        handlers: Dict[str, Callable[[A2LBlock], None]] = {}
+        if not keep_raw and self.workers <= 1:
+            for tag, parse in _record_parsers().items():
+                def handle(blk: A2LBlock, parse: Callable[[A2LBlock, bool], Any] = parse,
+                           append: Callable[[Any], None] = records.setdefault(tag, []).append) -> None:
+                    append(parse(blk, False))
+                handlers[tag] = handle
+
+        bb = BlockBuilder(handlers)
+        for ln in lines:
             bb.feed_line(ln)
-        root = bb.get_root()
+        bb.close()
+        return self._build_model(bb.get_root(), records)
+
+    @_sharing_strings()
+    def _parse_incremental(self, text: str, prior: A2LModel | None) -> A2LModel:
+        """
+        Parse ``text`` with streamed records, taking over the unchanged records of ``prior``.
+
+        Text between reused records is fed to the BlockBuilder line by line as
+        usual; a record span from ``_reusable_spans`` is skipped instead when the
+        builder is directly inside the record MODULE and not inside a comment.
+        The position of every record is kept in the returned model.
+        """
+        records: Dict[str, list[Any]] = {}
+        spans: list[Tuple[int, int, str, Any]] = []
+        reused: set[int] = set()  # ids of the records taken over from prior
+        line_span = [0, 0]  # of the line being fed
+        begin = [0]  # start of the last /begin line one level below MODULE
+        closing = [False]  # records still open at the end have no /end line
+        handlers: Dict[str, Callable[[A2LBlock], None]] = {}
+        for tag, parse in _record_parsers().items():
+            def handle(blk: A2LBlock, tag: str = tag, parse: Callable[[A2LBlock, bool], Any] = parse,
+                       out: list[Any] = records.setdefault(tag, [])) -> None:
+                rec = parse(blk, False)
+                out.append(rec)
+                if not closing[0]:
+                    spans.append((begin[0], line_span[1], tag, rec))
+            handlers[tag] = handle
+
+        bb = BlockBuilder(handlers)
+        root, stack = bb.get_root(), bb.stack
+
+        read: Deque[Tuple[int, int]] = deque()  # spans of the lines read but not yet fed
+
+        def lines(pos: int, end: int) -> Iterator[str]:
+            for m in _LINE_RE.finditer(text, pos, end):
+                read.append(m.span())
+                yield m.group()
+
+        def feed(pos: int, end: int) -> None:
+            # pos is never inside a block comment, so the comment state starts clean;
+            # lines come out of _iter_uncommented one per line read, but possibly later
+            for ln in _iter_uncommented(lines(pos, end)):
+                line_span[:] = read.popleft()
+                depth = len(stack)
+                bb.feed_line(ln)
+                if depth == 3 and len(stack) == 4:
+                    begin[0] = line_span[0]
+
+        module: A2LBlock | None = None  # the record MODULE, once begun
+        pos = 0
+        for start, end, tag, rec in _reusable_spans(prior, text):
+            if start < pos or _ends_in_comment(text, pos, start):
+                continue
+            if not text[pos:start].isspace():
+                # blank lines between records would feed nothing
+                feed(pos, start)
+            pos = start
+            if module is None and len(stack) == 3 and stack[1] is root.get_first_child("PROJECT"):
+                module = stack[1].get_first_child("MODULE")
+            if len(stack) == 3 and stack[2] is module:
+                records[tag].append(rec)
+                reused.add(id(rec))
+                spans.append((start, end, tag, rec))
+                pos = end
+        feed(pos, len(text))
+        closing[0] = True
+        bb.close()
+
+        model = self._build_model(root, records, reused)
+        model._source = text
+        model._spans = spans
+        return model
+
+    def _build_model(self, root: A2LBlock, records: Dict[str, list[Any]], reused: Container[int] = ()) -> A2LModel:
+        """
+        Assemble the model from the block tree and the records already streamed out of it, if any.
 
-        model = A2LModel(raw_blocks=[root])
+        ``reused`` holds the ids of records taken over from a prior model; they
+        are shared with it and therefore never modified.
+        """
+        keep_raw = self.keep_raw
+        model = A2LModel(raw_blocks=[root] if keep_raw else [])
 
         proj = root.get_first_child("PROJECT")
         if proj:
@@ -1595,50 +2598,54 @@ class A2LParser:
                 model.module_name = mod.args[0]
 
             if mod:
-                for ifd in mod.get_children("IF_DATA"):
+                # one indexing pass per block serves all lookups below
+                sections = mod.children_by_name
+                for ifd in sections.get("IF_DATA", ()):
                     if ifd.args and ifd.args[0] == "XCPplus":
-                        pl = ifd.get_first_child("PROTOCOL_LAYER")
+                        kids = ifd.children_by_name
+                        pl = kids.get("PROTOCOL_LAYER")
                         if pl:
-                            model.protocol_layer = parse_protocol_layer(pl)
+                            model.protocol_layer = parse_protocol_layer(pl[0], keep_raw)
 
-                        dq = ifd.get_first_child("DAQ")
+                        dq = kids.get("DAQ")
                         if dq:
-                            model.daq = parse_daq(dq)
+                            model.daq = parse_daq(dq[0], keep_raw)
                             model.daq_events = list(model.daq.events)
 
-                        xcp_can = ifd.get_first_child("XCP_ON_CAN")
+                        xcp_can = kids.get("XCP_ON_CAN")
                         if xcp_can:
-                            model.xcp_on_can = parse_xcp_on_can(xcp_can)
+                            model.xcp_on_can = parse_xcp_on_can(xcp_can[0], keep_raw)
 
-                mod_par = mod.get_first_child("MOD_PAR")
+                mod_par = sections.get("MOD_PAR")
                 if mod_par:
-                    for ms in mod_par.get_children("MEMORY_SEGMENT"):
-                        model.memory_segments.append(parse_memory_segment(ms))
-
-                for ax in mod.get_children("AXIS_PTS"):
-                    model.axis_pts.append(parse_axis_pts(ax))
-
-                for meas in mod.get_children("MEASUREMENT"):
-                    model.measurements.append(parse_measurement(meas))
-
+                    for ms in mod_par[0].children_by_name.get("MEMORY_SEGMENT", ()):
+                        model.memory_segments.append(parse_memory_segment(ms, keep_raw))
+
+                if not records:
+                    with self._pool(mod) as pool:
+                        # submit the pooled (large) kinds first, then parse the small
+                        # kinds here while the workers process the large ones
+                        parsers = _record_parsers()
+                        order = sorted(parsers, key=lambda tag: len(sections.get(tag, ())) < _PARALLEL_MIN_BLOCKS)
+                        parts = {tag: self._parse_many(parsers[tag], sections.get(tag, ()), pool) for tag in order}
+                        records = {tag: [r for part in parts[tag] for r in part] for tag in parsers}
+                model.axis_pts = records["AXIS_PTS"]
+                model.measurements = records["MEASUREMENT"]
                 # NEW: CHARACTERISTIC
-                for ch in mod.get_children("CHARACTERISTIC"):
-                    model.characteristics.append(parse_characteristic(ch))
-
-                for cm in mod.get_children("COMPU_METHOD"):
-                    model.compu_methods.append(parse_compu_method(cm))
-
-                for cv in mod.get_children("COMPU_VTAB"):
-                    model.compu_vtabs.append(parse_compu_vtab(cv))
-
-                for rl in mod.get_children("RECORD_LAYOUT"):
-                    model.record_layouts.append(parse_record_layout(rl))
-
-                for grp in mod.get_children("GROUP"):
-                    model.groups.append(parse_group(grp))
-
-                for fn in mod.get_children("FUNCTION"):
-                    model.functions.append(parse_function(fn))
+                model.characteristics = records["CHARACTERISTIC"]
+                model.compu_vtabs = records["COMPU_VTAB"]
+                model.groups = records["GROUP"]
+                model.functions = records["FUNCTION"]
+
+                seen: Dict[Tuple[Any, ...], Any] = {}
+                for c in records["COMPU_METHOD"]:
+                    # float.hex keeps 0.0 and -0.0 apart
+                    key = (c.description, c.method_type, c.format_str, c.unit, tuple(map(float.hex, c.coeffs)))
+                    model.compu_methods.append(_share_identical(c, key, seen, ("description", "format_str", "unit", "coeffs"), reused))
+
+                seen = {}
+                for r in records["RECORD_LAYOUT"]:
+                    model.record_layouts.append(_share_identical(r, tuple(r.entries), seen, ("entries",), reused))
 
         return model
 
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Build script for a2lmodel.
+
+Project metadata lives in pyproject.toml; this file only adds the optional
+Cython build of the parser module. When Cython is importable at build time,
+``a2lmodel/a2l_model.py`` is compiled to a C extension that shadows the pure
+Python module and removes interpreter overhead from the per-block ``parse_*``
+loops. Without Cython (or with ``PYA2L_CYTHON=False``) the package installs
+as plain Python.
+
+Usage:
+    pip install cython && pip install --no-build-isolation .   # compiled build
+    PYA2L_CYTHON=False pip install .                           # pure Python build
+"""
+
+import os
+
+from setuptools import setup
+
+
+def _want_cython() -> bool:
+    return os.environ.get("PYA2L_CYTHON", "True").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _ext_modules() -> list:
+    if not _want_cython():
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    return cythonize(
+        ["a2lmodel/a2l_model.py"],
+        compiler_directives={"language_level": 3},
+        quiet=True,
+    )
+
+
+setup(ext_modules=_ext_modules())
@@ -1,8 +1,24 @@
+import codecs
+import copy
+import io
+import json
+import math
+import mmap
+import os
+import pickle
+import shlex
 import sys
+import tempfile
+import threading
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 
 from a2lmodel import A2LParser
+from a2lmodel import a2l_model
+from a2lmodel.a2l_model import BlockBuilder, _split_args, tokenize_line
 
 class TestA2LParser(unittest.TestCase):
 
@@ -23,4 +39,400 @@ class TestA2LParser(unittest.TestCase):
         self.assertEqual(self.model.characteristics[1].name, 'TestCalib2')
         self.assertEqual(self.model.characteristics[2].address, 0xb050C0AC)
         self.assertEqual(self.model.characteristics[2].name, 'TestCalib3')
-        self.assertEqual(len(self.model.axis_pts), 2)
\ No newline at end of file
+        self.assertEqual(len(self.model.axis_pts), 2)
+
+    def test_daq_event_names(self)->None:
+        events = [(e.name, e.short_name, e.cycle) for e in self.model.daq_events]
+        self.assertEqual(events, [("XcpEventChannel_1ms", "XEvC1ms", 1), ("XcpEventChannel_10ms", "XEvC10ms", 10),
+                                  ("XcpEventChannel_100ms", "XEvC100ms", 100)])
+
+class TestTokenizeLine(unittest.TestCase):
+
+    def test_quoted_and_bare_tokens(self)->None:
+        self.assertEqual(tokenize_line('NAME "Long Description" VALUE'), ['NAME', 'Long Description', 'VALUE'])
+        self.assertEqual(tokenize_line('SYMBOL_LINK "Testvar1" 0'), ['SYMBOL_LINK', 'Testvar1', '0'])
+        self.assertEqual(tokenize_line('""'), [''])
+        self.assertEqual(tokenize_line("   "), [])
+
+    def test_matches_shlex(self)->None:
+        for line in ('"Torque \\"max\\" limit"', '"back\\\\slash"', '"a"""', '"a" ""', '"x"y z', "'it''s' x", "a'b c'd",
+                     'q\\ z', '"open', 'ECU_ADDRESS 0x4000D944', '\t"Engine speed"  UWORD'):
+            try:
+                expected = shlex.split(line, posix=True)
+            except ValueError:
+                expected = line.split()
+            self.assertEqual(tokenize_line(line), expected, line)
+            self.assertEqual(a2l_model.flat_tokens([line, "x"]), expected + ["x"], line)
+        self.assertEqual(a2l_model._line_description('  "Torque \\"max\\" limit"'), 'Torque "max" limit')
+
+
+class TestNumberConversion(unittest.TestCase):
+
+    def test_matches_plain_int_and_float(self)->None:
+        def int_or_none(token: str)->"int | None":
+            try:
+                return int(token, 16) if token.lower().startswith("0x") else int(token)
+            except ValueError:
+                return None
+
+        def float_or_none(token: str)->"float | None":
+            try:
+                return float(token)
+            except ValueError:
+                return None
+
+        for token in ("0", "123", "007", "-5", "+5", "1_000", "1__0", "_1", "1_", "0x7B", "0X7b", "0x_1F", "-0x10",
+                      "0xG", "0b101", "\u0663", "\uff11\uff12", "1.5", "-1.5e3", ".5", "5.", "1_0.5", "1e", "inf", "-inf",
+                      "+Infinity", "iNf", "infinit", "NaN", "-nan", "nanx", "UWORD", "x1", "%6.2", '"1"', "/1", ""):
+            self.assertEqual(a2l_model.to_int(token), int_or_none(token), token)
+            expected = float_or_none(token)
+            got = a2l_model.to_float(token)
+            if expected is not None and math.isnan(expected):
+                self.assertTrue(got is not None and math.isnan(got), token)
+            else:
+                self.assertEqual(got, expected, token)
+
+class TestSplitArgs(unittest.TestCase):
+
+    def test_matches_shlex(self)->None:
+        for args in ('PF1_APPL_SWID "PF1 APPL SWID"', 'P ""', "A\tB", 'a"b c"d', "'it''s' x", 'q\\ z', '"open'):
+            try:
+                expected = shlex.split(args, posix=True)
+            except ValueError:
+                expected = args.split()
+            self.assertEqual(_split_args(args), expected, args)
+
+
+class TestParseText(unittest.TestCase):
+
+    def test_text_matches_file(self)->None:
+        with open("test/demo.a2l", encoding="utf-8") as f:
+            text = f.read()
+        self.assertEqual(A2LParser().parse_text(text).to_dict(), A2LParser().parse_file("test/demo.a2l").to_dict())
+
+    def test_multiline_comment_keeps_lines_apart(self)->None:
+        text = ('/begin PROJECT P ""\r\n/begin MODULE M ""\r\n/begin COMPU_METHOD cm /* one\n'
+                'two */ "desc"\r\n IDENTICAL\n/end COMPU_METHOD\n/end MODULE\n/end PROJECT\n')
+        cm = A2LParser().parse_text(text).compu_methods[0]
+        self.assertEqual((cm.name, cm.description, cm.method_type), ("cm", "desc", "IDENTICAL"))
+
+    def test_comments_across_text_blocks(self)->None:
+        text = 'A /* x\r\n\r\n y */ B\rC /* z */ D\n/* open\nE */\n\nF'
+        with mock.patch.object(a2l_model, "_DECODE_BLOCK_SIZE", 4):
+            lines = list(a2l_model.iter_text_lines_no_comments(text))
+        self.assertEqual(lines, ["A ", " B", "C  D", "", "", "F"])
+
+    def test_unclosed_comment_across_blocks(self)->None:
+        text = 'A /* x */ B\nC /* stray\nD */ E /* open\nF\n\nG'
+        expected = ["A  B", "C ", " E /* open", "F", "G"]
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(a2l_model, "_DECODE_BLOCK_SIZE", 8):
+            path = Path(tmp) / "stray.a2l"
+            path.write_bytes(text.encode("utf-8"))
+            self.assertEqual(list(a2l_model.iter_lines_no_comments(path)), expected)
+            self.assertEqual(list(a2l_model.iter_text_lines_no_comments(text)), expected)
+
+    def test_unclosed_comment_left_in_place(self)->None:
+        text = ('/begin PROJECT P ""\n/begin MODULE M ""\n/begin MEASUREMENT a ""\nUWORD\n/end MEASUREMENT\n'
+                '/* stray opener in a trailing note\n/begin MEASUREMENT b ""\nUWORD\n/end MEASUREMENT\n/end MODULE\n/end PROJECT\n')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "stray.a2l"
+            path.write_text(text, encoding="utf-8")
+            from_file = A2LParser().parse_file(path)
+        self.assertEqual([m.name for m in A2LParser().parse_text(text).measurements], ["a", "b"])
+        self.assertEqual(from_file.to_dict(), A2LParser().parse_text(text).to_dict())
+        self.assertEqual(list(a2l_model.iter_text_lines_no_comments("x /* c */ y /* open\nz")), ["x  y /* open", "z"])
+
+
+class TestFileEncoding(unittest.TestCase):
+
+    def test_blockwise_decode(self)->None:
+        text = ('/begin PROJECT P ""\r/begin MODULE M ""\r\n/begin COMPU_METHOD cm\r\n"Temp\xe9rature"\r\n'
+                'RAT_FUNC\r"%6.2"\n"\xb0C"\n/end COMPU_METHOD\r/end MODULE\n/end PROJECT')
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(a2l_model, "_DECODE_BLOCK_SIZE", 16):
+            path = Path(tmp) / "latin1.a2l"
+            path.write_bytes(text.encode("latin-1"))
+            latin1 = A2LParser(encoding="latin-1").parse_file(path)
+            utf8 = A2LParser().parse_file(path)
+        self.assertEqual(latin1.to_dict(), A2LParser().parse_text(text).to_dict())
+        self.assertEqual((latin1.compu_methods[0].description, latin1.compu_methods[0].unit), ("Temp\xe9rature", "\xb0C"))
+        self.assertEqual((utf8.compu_methods[0].description, utf8.compu_methods[0].unit), ("Temprature", "C"))
+
+    def test_byte_order_mark(self)->None:
+        data = Path("test/demo.a2l").read_bytes()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bom.a2l"
+            path.write_bytes(codecs.BOM_UTF8 + data)
+            model = A2LParser(encoding="utf-8-sig").parse_file(path)
+        self.assertEqual(model.to_dict(), A2LParser().parse_file("test/demo.a2l").to_dict())
+
+    def test_cr_only_round_trip(self)->None:
+        model = A2LParser().parse_file("test/demo.a2l")
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(a2l_model, "_DECODE_BLOCK_SIZE", 256):
+            path = Path(tmp) / "out.a2l"
+            model.to_file(str(path))
+            data = path.read_bytes()
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                blocks = list(a2l_model._iter_decoded_blocks(mm, "utf-8"))
+            read = list(a2l_model._iter_read_blocks(io.BytesIO(data), "utf-8"))
+            reread = A2LParser().parse_file(path)
+        self.assertNotIn(b"\n", data)
+        for parts in (blocks, read):
+            self.assertGreater(len(parts), len(data) // 512)
+            self.assertTrue(all(b.endswith("\r") for b in parts[:-1]))
+            self.assertEqual("".join(parts), data.decode("utf-8"))
+        self.assertEqual(reread.to_dict(), A2LParser().parse_text(data.decode("utf-8")).to_dict())
+        self.assertEqual([m.name for m in reread.measurements], [m.name for m in model.measurements])
+
+    def test_rejects_non_ascii_compatible_encoding(self)->None:
+        with self.assertRaises(ValueError):
+            A2LParser(encoding="utf-16")
+        with self.assertRaises(ValueError):
+            list(a2l_model.iter_lines_no_comments("test/demo.a2l", encoding="utf-32"))
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs named pipes")
+    def test_parse_file_from_pipe(self)->None:
+        data = Path("test/demo.a2l").read_bytes()
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.object(a2l_model, "_DECODE_BLOCK_SIZE", 64):
+            fifo = Path(tmp) / "demo.a2l"
+            os.mkfifo(fifo)
+            writer = threading.Thread(target=fifo.write_bytes, args=(data,))
+            writer.start()
+            model = A2LParser().parse_file(fifo)
+            writer.join()
+        self.assertEqual(model.to_dict(), A2LParser().parse_file("test/demo.a2l").to_dict())
+
+
+class TestCompuVTab(unittest.TestCase):
+
+    def test_plain_and_mixed_rows(self)->None:
+        head = ['""', "TAB_VERB"]
+        plain = a2l_model.A2LBlock(name="COMPU_VTAB", args=["v"], lines=head + ["2", '\t0 "OFF"', '\t-1 "NOT SET"'])
+        mixed = a2l_model.A2LBlock(name="COMPU_VTAB", args=["v"], lines=head + ["3", '\t0x10 "HEX"', "\t1 'Q'", '\t2 "it\'s"', '\t3 "extra"'])
+        self.assertEqual(a2l_model.parse_compu_vtab(plain).entries, [(0, "OFF"), (-1, "NOT SET")])
+        self.assertEqual(a2l_model.parse_compu_vtab(mixed).entries, [(16, "HEX"), (1, "Q"), (2, "it's")])
+
+
+class TestIncrementalParse(unittest.TestCase):
+
+    def test_reparse_reuses_unchanged_records(self)->None:
+        with open("test/demo.a2l", encoding="utf-8") as f:
+            text = f.read()
+        parser = A2LParser(incremental=True)
+        prior = parser.parse_text(text)
+        edited = text.replace("ECU_ADDRESS 0x4000D944", "ECU_ADDRESS 0x4000D948", 1)
+        model = parser.parse_text(edited, prior=prior)
+        self.assertEqual(model.to_dict(), A2LParser().parse_text(edited).to_dict())
+        self.assertEqual(model.measurements[0].ecu_address, 0x4000D948)
+        self.assertIsNot(model.measurements[0], prior.measurements[0])
+        self.assertIs(model.measurements[1], prior.measurements[1])
+        self.assertIs(model.compu_methods[-1], prior.compu_methods[-1])
+        opened = parser.parse_text(edited.replace("/begin MEASUREMENT", "/* /begin MEASUREMENT", 1), prior=model)
+        self.assertEqual(len(opened.measurements), 0)
+
+    def test_prior_records_left_unchanged(self)->None:
+        body = '"" RAT_FUNC "%6.2" "rpm"\n COEFFS 0 1 0 0 0 1\n'
+        text = ('/begin PROJECT P ""\n/begin MODULE M ""\n/begin GROUP g ""\n/end GROUP\n'
+                f'/begin COMPU_METHOD cm_a\n{body}/end COMPU_METHOD\n/end MODULE\n/end PROJECT\n')
+        parser = A2LParser(incremental=True)
+        prior = parser.parse_text(text)
+        cm_a = prior.compu_methods[0]
+        fields = (cm_a.coeffs, cm_a.unit, cm_a.description)
+        # a copy of cm_a's body with other whitespace is parsed anew, ahead of the reused cm_a
+        variant = f'/begin COMPU_METHOD cm_b\n{body.replace(" ", "  ")}/end COMPU_METHOD'
+        model = parser.parse_text(text.replace('/begin GROUP g ""\n/end GROUP', variant), prior=prior)
+        self.assertIs(model.compu_methods[1], cm_a)
+        self.assertEqual(model.compu_methods[0].coeffs, cm_a.coeffs)
+        for before, after in zip(fields, (cm_a.coeffs, cm_a.unit, cm_a.description)):
+            self.assertIs(after, before)
+
+    def test_unclosed_comment_matches_full_parse(self)->None:
+        with open("test/demo.a2l", encoding="utf-8") as f:
+            text = f.read()
+        parser = A2LParser(incremental=True)
+        prior = parser.parse_text(text)
+        idx = text.index("/begin CHARACTERISTIC")
+        stray = text[:idx] + "/* stray opener in a note\n" + text[idx:]
+        model = parser.parse_text(stray, prior=prior)
+        self.assertEqual(model.to_dict(), A2LParser().parse_text(stray).to_dict())
+        self.assertEqual(len(model.measurements), 2)
+        self.assertIs(model.measurements[1], prior.measurements[1])
+
+    def test_prior_needs_incremental_parser(self)->None:
+        prior = A2LParser(incremental=True).parse_text("")
+        with self.assertRaises(ValueError):
+            A2LParser().parse_text("", prior=prior)
+        with self.assertRaises(ValueError):
+            A2LParser(keep_raw=True, incremental=True)
+
+
+class TestSymbolLink(unittest.TestCase):
+
+    def test_keyword_is_upper_case_only(self)->None:
+        kinds = ((a2l_model.parse_measurement, a2l_model._MEASUREMENT_HEAD),
+                 (a2l_model.parse_axis_pts, a2l_model._AXIS_PTS_HEAD),
+                 (a2l_model.parse_characteristic, a2l_model._CHARACTERISTIC_HEAD))
+        for parse, head in kinds:
+            for keyword, expected in (("SYMBOL_LINK", ("sym", 4)), ("symbol_link", None)):
+                lines = ['"desc"'] + ["0"] * (len(head) - 1) + [f'{keyword} "sym" 4']
+                rec = parse(a2l_model.A2LBlock(name="X", args=["x"], lines=lines), False)
+                self.assertEqual(rec.symbol_link, expected, (parse.__name__, keyword))
+
+class TestRecordStreaming(unittest.TestCase):
+
+    def test_module_records_go_to_handlers(self)->None:
+        seen = []
+        bb = BlockBuilder({"MEASUREMENT": seen.append})
+        for line in ("/begin PROJECT P", "/begin MODULE M", "/begin MEASUREMENT a", "UWORD",
+                     "/begin IF_DATA X", "/end IF_DATA", "/end MEASUREMENT", "/begin MOD_PAR \"\"",
+                     "/begin MEASUREMENT inner", "/end MEASUREMENT", "/end MOD_PAR", "/begin measurement b"):
+            bb.feed_line(line)
+        self.assertEqual([blk.args[0] for blk in seen], ["a"])
+        bb.close()
+        self.assertEqual([blk.args[0] for blk in seen], ["a", "b"])
+        self.assertEqual(seen[0].lines, ["UWORD"])
+        self.assertEqual(len(seen[0].children), 1)
+        module = bb.get_root().get_first_child("PROJECT").get_first_child("MODULE")
+        self.assertEqual([c.name for c in module.children], ["MOD_PAR"])
+        self.assertEqual(list(module.children_by_name), ["MOD_PAR"])
+        self.assertEqual(module.children_by_name["MOD_PAR"][0].children_by_name["MEASUREMENT"][0].args, ["inner"])
+
+
+class TestKeepRaw(unittest.TestCase):
+
+    def test_raw_dropped_by_default(self)->None:
+        model = A2LParser().parse_file("test/demo.a2l")
+        self.assertEqual(model.measurements[0].raw, [])
+        self.assertEqual(model.raw_blocks, [])
+        as_dict = model.to_dict()
+        self.assertNotIn("raw_blocks", as_dict)
+        self.assertNotIn("raw", as_dict["measurements"][0])
+
+    def test_raw_kept_on_request(self)->None:
+        model = A2LParser(keep_raw=True).parse_file("test/demo.a2l")
+        self.assertIn("\t\tECU_ADDRESS 0x4000D944", model.measurements[0].raw)
+        self.assertEqual(model.raw_blocks[0].name, "ROOT")
+        self.assertEqual(model.to_dict()["measurements"][0]["raw"], model.measurements[0].raw)
+
+    def test_raw_key_follows_option(self)->None:
+        text = '/begin PROJECT P ""\n/begin MODULE M ""\n/begin GROUP g ""\n/begin REF_MEASUREMENT m\n/end REF_MEASUREMENT\n/end GROUP\n/end MODULE\n/end PROJECT\n'
+        kept = A2LParser(keep_raw=True).parse_text(text).to_dict()
+        dropped = A2LParser().parse_text(text).to_dict()
+        self.assertEqual(kept["groups"][0]["raw"], [])
+        self.assertIn("raw_blocks", kept)
+        self.assertNotIn("raw", dropped["groups"][0])
+
+
+class TestRecordTables(unittest.TestCase):
+
+    def test_measurement_table_matches_records(self)->None:
+        model = A2LParser().parse_file("test/demo.a2l")
+        table = model.measurement_table()
+        self.assertEqual(len(table), len(model.measurements))
+        for view, meas in zip(table, model.measurements):
+            self.assertEqual(view.name, meas.name)
+            self.assertEqual(view.ecu_address, meas.ecu_address)
+            self.assertEqual(view.datatype, meas.datatype)
+            self.assertIsNone(view.lower_limit)
+        self.assertEqual(table.rows_where("datatype", "UWORD"), [0, 1])
+        self.assertEqual(model.characteristic_table()[2].address, 0xb050C0AC)
+
+    def test_int_columns_keep_full_range_and_none(self)->None:
+        rows = [SimpleNamespace(name=n, description="", compu_method="NO_COMPU_METHOD", datatype="UBYTE",
+                                lower_limit=0.0, upper_limit=1.0, ecu_address=a, address=b)
+                for n, a, b in (("top", 0xFFFFFFFFFFFFFFFF, None), ("zero", 0, 0), ("neg", 1, -1))]
+        table = a2l_model.MeasurementTable(rows)
+        self.assertEqual([v.ecu_address for v in table], [0xFFFFFFFFFFFFFFFF, 0, 1])
+        self.assertEqual([v.address for v in table], [None, 0, -1])
+        self.assertEqual(table.rows_where("address", 0), [1])
+        self.assertEqual(table.rows_where("address", None), [0])
+
+    def test_float_columns_keep_nan_apart_from_none(self)->None:
+        rows = [SimpleNamespace(name=n, description="", compu_method="NO_COMPU_METHOD", datatype="UBYTE",
+                                lower_limit=lo, upper_limit=1.0, ecu_address=0, address=None)
+                for n, lo in (("nan", float("nan")), ("none", None), ("zero", 0.0))]
+        table = a2l_model.MeasurementTable(rows)
+        self.assertTrue(math.isnan(table[0].lower_limit))
+        self.assertEqual([v.lower_limit for v in table][1:], [None, 0.0])
+        self.assertEqual(table.rows_where("lower_limit", None), [1])
+        self.assertEqual(table.rows_where("lower_limit", float("nan")), [0])
+        self.assertEqual(table.rows_where("lower_limit", 0.0), [2])
+
+    def test_views_copy_and_pickle(self)->None:
+        view = A2LParser().parse_file("test/demo.a2l").measurement_table()[1]
+        self.assertEqual(copy.copy(view).name, view.name)
+        self.assertEqual(pickle.loads(pickle.dumps(view)).ecu_address, view.ecu_address)
+
+
+class TestNumericArrays(unittest.TestCase):
+
+    def test_arrays_serialise_as_lists(self)->None:
+        model = A2LParser().parse_file("test/demo.a2l")
+        self.assertEqual(model.protocol_layer.timing_values.typecode, "q")
+        self.assertEqual(model.compu_methods[0].coeffs.typecode, "d")
+        as_dict = model.to_dict()
+        self.assertEqual(as_dict["protocol_layer"]["timing_values"][:2], [256, 1280])
+        self.assertEqual(as_dict["compu_methods"][0]["coeffs"], [0.0, 10.0, 0.0, 0.0, 0.0, 1.0])
+
+
+class TestWriteJson(unittest.TestCase):
+
+    def test_write_json_matches_to_dict(self)->None:
+        model = A2LParser().parse_file("test/demo.a2l")
+        buf = io.StringIO()
+        model.write_json(buf, indent=1)
+        self.assertEqual(json.loads(buf.getvalue()), json.loads(json.dumps(model.to_dict())))
+        self.assertNotIn('"raw":', buf.getvalue())
+
+
+class TestParallelParse(unittest.TestCase):
+
+    def test_workers_match_serial_parse(self)->None:
+        serial = A2LParser().parse_file("test/demo.a2l")
+        with mock.patch.object(a2l_model, "_PARALLEL_MIN_BLOCKS", 2):
+            parallel = A2LParser(workers=2).parse_file("test/demo.a2l")
+        self.assertEqual(parallel.to_dict(), serial.to_dict())
+
+    def test_parse_files_matches_parse_file(self)->None:
+        expected = A2LParser().parse_file("test/demo.a2l").to_dict()
+        models = A2LParser(workers=2).parse_files(["test/demo.a2l", Path("test/demo.a2l")])
+        self.assertEqual([m.to_dict() for m in models], [expected, expected])
+        self.assertEqual(A2LParser().parse_files([]), [])
+
+
+class TestSharedBodies(unittest.TestCase):
+
+    def test_identical_compu_methods_share_values(self)->None:
+        body = '"" RAT_FUNC "%5.0" "rpm"\n COEFFS 0 10 0 0 0 1\n'
+        text = ('/begin PROJECT P ""\n/begin MODULE M ""\n'
+                f'/begin COMPU_METHOD cm_a\n{body}/end COMPU_METHOD\n'
+                f'/begin COMPU_METHOD cm_b\n{body}/end COMPU_METHOD\n'
+                '/end MODULE\n/end PROJECT\n')
+        first, second = A2LParser().parse_text(text).compu_methods
+        self.assertEqual((first.name, second.name), ("cm_a", "cm_b"))
+        self.assertIs(first.unit, second.unit)
+        self.assertEqual(first.coeffs, second.coeffs)
+        self.assertIsNot(first.coeffs, second.coeffs)
+
+    def test_identical_bodies_parsed_once(self)->None:
+        text = ('/begin PROJECT P ""\n/begin MODULE M ""\n'
+                + ''.join(f'/begin RECORD_LAYOUT rl_{k}\n FNC_VALUES 1 UWORD ROW_DIR DIRECT\n/end RECORD_LAYOUT\n' for k in range(3))
+                + '/end MODULE\n/end PROJECT\n')
+        with mock.patch.object(a2l_model, "parse_record_layout", wraps=a2l_model.parse_record_layout) as parse:
+            layouts = A2LParser(keep_raw=True).parse_text(text).record_layouts
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual([rl.name for rl in layouts], ["rl_0", "rl_1", "rl_2"])
+        self.assertEqual(layouts[2].entries, ["FNC_VALUES 1 UWORD ROW_DIR DIRECT"])
+        self.assertIsNot(layouts[0].raw, layouts[1].raw)
+
+    def test_strings_shared_per_parse_only(self)->None:
+        body = '"Engine speed at the crank"\nUWORD\ncm_speed\n1\n1\n0\n100\n'
+        text = ('/begin PROJECT P ""\n/begin MODULE M ""\n'
+                f'/begin MEASUREMENT m_a\n{body}/end MEASUREMENT\n'
+                f'/begin MEASUREMENT m_b\n{body}/end MEASUREMENT\n'
+                '/begin COMPU_METHOD cm_speed\n""\nIDENTICAL\n"%6.2"\n"rpm"\n/end COMPU_METHOD\n'
+                '/end MODULE\n/end PROJECT\n')
+        model = A2LParser().parse_text(text)
+        first, second = model.measurements
+        self.assertIs(first.description, second.description)
+        self.assertIs(first.compu_method, model.compu_methods[0].name)
+        self.assertIsNone(a2l_model._PARSE_STRINGS.get())